@@ -11,15 +11,24 @@ This server provides tools to interact with WebLogic Server domains including:
 - Custom WLST script execution
 '''
 
+import io
 import os
+import sys
 import json
+import re
+import signal
+import time
+import atexit
+import functools
+import uuid
+import string
 import tempfile
 import subprocess
 import asyncio
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Annotated, Union, Sequence
 from enum import Enum
 from pathlib import Path
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict, StringConstraints
 from mcp.server.fastmcp import FastMCP
 
 # Initialize the MCP server
@@ -34,6 +43,18 @@ WLST_PATH = os.environ.get("WLST_PATH", "wlst.cmd" if os.name == "nt" else "wlst
 WEBLOGIC_HOME = os.environ.get("WEBLOGIC_HOME", "")
 DEFAULT_TIMEOUT = int(os.environ.get("WLST_TIMEOUT", "120"))
 DEFAULT_SHUTDOWN_TIMEOUT = int(os.environ.get("WLST_SHUTDOWN_TIMEOUT", "300"))
+# WLST_MAX_CONCURRENCY is honored as an alias: the pool is what bounds the
+# number of concurrently executing WLST jobs.
+POOL_SIZE = int(os.environ.get("WLST_POOL_SIZE",
+                               os.environ.get("WLST_MAX_CONCURRENCY", "2")))
+WORKER_STARTUP_TIMEOUT = int(os.environ.get("WLST_WORKER_STARTUP_TIMEOUT", "120"))
+BATCH_MAX = int(os.environ.get("WLST_BATCH_MAX", "8"))
+BATCH_WINDOW_MS = int(os.environ.get("WLST_BATCH_WINDOW_MS", "25"))
+MAX_OUTPUT_BYTES = int(os.environ.get("WLST_MAX_OUTPUT_BYTES", str(16 * 1024 * 1024)))
+CONN_TTL = int(os.environ.get("WLST_CONN_TTL", "30"))
+WORKER_IDLE_TIMEOUT = int(os.environ.get("WLST_WORKER_IDLE_TIMEOUT", "600"))
+LIST_CACHE_TTL = int(os.environ.get("WLST_LIST_CACHE_TTL", "30"))
+INLINE_OUTPUT_LIMIT = int(os.environ.get("WLST_INLINE_OUTPUT_LIMIT", str(256 * 1024)))
 
 # Default connection credentials from environment variables
 DEFAULT_ADMIN_URL = os.environ.get("WLST_ADMIN_URL", "")
@@ -64,18 +85,22 @@ class ServerState(str, Enum):
 # Pydantic Models for Input Validation
 # =============================================================================
 
-class ConnectionInput(BaseModel):
-    '''Input model for WebLogic connection.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
+# Trimmed string for short identifier fields; str_strip_whitespace is not
+# enabled model-wide so large fields (scripts, JDBC URLs, passwords) are not
+# scanned on every request.
+_StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+class _AuthBase(BaseModel):
+    '''Base model with shared connection fields and credential fallbacks.'''
+    model_config = ConfigDict(validate_assignment=True, extra='forbid')
 
-    admin_url: Optional[str] = Field(
+    admin_url: Optional[_StrippedStr] = Field(
         default=None,
         description="Admin Server URL (e.g., 't3://localhost:7001'). Uses WLST_ADMIN_URL env var if not provided.",
         max_length=500
     )
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.", max_length=100)
+    username: Optional[_StrippedStr] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.", max_length=100)
     password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    timeout: Optional[int] = Field(default=DEFAULT_TIMEOUT, description="Connection timeout in seconds", ge=10, le=600)
 
     def get_admin_url(self) -> str:
         return self.admin_url or DEFAULT_ADMIN_URL
@@ -86,6 +111,24 @@ class ConnectionInput(BaseModel):
     def get_password(self) -> str:
         return self.password or DEFAULT_PASSWORD
 
+    def get_creds(self) -> Optional[tuple]:
+        '''Resolve (admin_url, username, password) in one pass, or None.
+
+        Returns None as soon as any credential is missing, so callers that
+        support an offline mode take one branch instead of three getter
+        calls plus three truthiness tests.
+        '''
+        admin_url = self.admin_url or DEFAULT_ADMIN_URL
+        if not admin_url:
+            return None
+        username = self.username or DEFAULT_USERNAME
+        if not username:
+            return None
+        password = self.password or DEFAULT_PASSWORD
+        if not password:
+            return None
+        return (admin_url, username, password)
+
     @field_validator('admin_url')
     @classmethod
     def validate_url(cls, v: Optional[str]) -> Optional[str]:
@@ -95,205 +138,62 @@ class ConnectionInput(BaseModel):
             raise ValueError("URL must start with t3://, t3s://, http://, or https://")
         return v
 
-class ListServersInput(BaseModel):
-    '''Input model for listing servers.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
+class ConnectionInput(_AuthBase):
+    '''Input model for WebLogic connection.'''
+    timeout: Optional[int] = Field(default=DEFAULT_TIMEOUT, description="Connection timeout in seconds", ge=10, le=600)
 
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
+class ListServersInput(_AuthBase):
+    '''Input model for listing servers.'''
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class ServerOperationInput(BaseModel):
+class ServerOperationInput(_AuthBase):
     '''Input model for server operations (start/stop/restart).'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    server_name: str = Field(..., description="Name of the managed server to operate on", min_length=1, max_length=100)
+    server_name: _StrippedStr = Field(..., description="Name of the managed server to operate on", min_length=1, max_length=100)
     force: Optional[bool] = Field(default=False, description="Force shutdown (immediate). If false, graceful shutdown waits for sessions to complete.")
     timeout: Optional[int] = Field(default=DEFAULT_SHUTDOWN_TIMEOUT, description="Operation timeout in seconds. Graceful shutdown may need longer timeout.", ge=10, le=600)
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class DeployInput(BaseModel):
+class DeployInput(_AuthBase):
     '''Input model for application deployment.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    app_name: str = Field(..., description="Application name", min_length=1, max_length=200)
+    app_name: _StrippedStr = Field(..., description="Application name", min_length=1, max_length=200)
     app_path: str = Field(..., description="Path to the application archive (WAR, EAR, JAR)")
     targets: Optional[str] = Field(default=None, description="Comma-separated list of target servers/clusters")
-    stage_mode: Optional[str] = Field(default="stage", description="Deployment stage mode: stage, nostage, or external_stage")
+    stage_mode: Optional[Literal['stage', 'nostage', 'external_stage']] = Field(default="stage", description="Deployment stage mode: stage, nostage, or external_stage")
     plan_path: Optional[str] = Field(default=None, description="Path to deployment plan XML")
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-    @field_validator('stage_mode')
-    @classmethod
-    def validate_stage_mode(cls, v: str) -> str:
-        valid_modes = ['stage', 'nostage', 'external_stage']
-        if v.lower() not in valid_modes:
-            raise ValueError(f"stage_mode must be one of: {', '.join(valid_modes)}")
-        return v.lower()
-
-class UndeployInput(BaseModel):
+class UndeployInput(_AuthBase):
     '''Input model for application undeployment.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    app_name: str = Field(..., description="Name of the application to undeploy", min_length=1, max_length=200)
+    app_name: _StrippedStr = Field(..., description="Name of the application to undeploy", min_length=1, max_length=200)
     targets: Optional[str] = Field(default=None, description="Comma-separated list of target servers/clusters (optional)")
     timeout: Optional[int] = Field(default=DEFAULT_TIMEOUT, description="Operation timeout", ge=10, le=600)
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class AppOperationInput(BaseModel):
+class AppOperationInput(_AuthBase):
     '''Input model for application operations (start/stop/redeploy).'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    app_name: str = Field(..., description="Name of the application", min_length=1, max_length=200)
+    app_name: _StrippedStr = Field(..., description="Name of the application", min_length=1, max_length=200)
     timeout: Optional[int] = Field(default=DEFAULT_TIMEOUT, description="Operation timeout in seconds", ge=10, le=600)
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class ListAppsInput(BaseModel):
+class ListAppsInput(_AuthBase):
     '''Input model for listing applications.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class ServerHealthInput(BaseModel):
+class ServerHealthInput(_AuthBase):
     '''Input model for server health check.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    server_name: Optional[str] = Field(default=None, description="Specific server name (optional, all servers if not specified)")
+    server_name: Optional[_StrippedStr] = Field(default=None, description="Specific server name (optional, all servers if not specified)")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class ServerMetricsInput(BaseModel):
+class ServerMetricsInput(_AuthBase):
     '''Input model for server metrics.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    server_name: str = Field(..., description="Server name to get metrics for")
-    metric_type: Optional[str] = Field(default="all", description="Type of metrics: all, jvm, threads, jdbc, jms")
+    server_name: _StrippedStr = Field(..., description="Server name to get metrics for")
+    metric_type: Optional[Literal['all', 'jvm', 'threads', 'jdbc', 'jms']] = Field(default="all", description="Type of metrics: all, jvm, threads, jdbc, jms")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-    @field_validator('metric_type')
-    @classmethod
-    def validate_metric_type(cls, v: str) -> str:
-        valid_types = ['all', 'jvm', 'threads', 'jdbc', 'jms']
-        if v.lower() not in valid_types:
-            raise ValueError(f"metric_type must be one of: {', '.join(valid_types)}")
-        return v.lower()
-
-class DatasourceInput(BaseModel):
+class DatasourceInput(_AuthBase):
     '''Input model for datasource operations.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class CreateDatasourceInput(BaseModel):
+class CreateDatasourceInput(_AuthBase):
     '''Input model for creating a datasource.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    ds_name: str = Field(..., description="Datasource name", min_length=1, max_length=200)
-    jndi_name: str = Field(..., description="JNDI name (e.g., jdbc/myDS)", min_length=1, max_length=500)
+    ds_name: _StrippedStr = Field(..., description="Datasource name", min_length=1, max_length=200)
+    jndi_name: _StrippedStr = Field(..., description="JNDI name (e.g., jdbc/myDS)", min_length=1, max_length=500)
     db_url: str = Field(..., description="Database JDBC URL")
     db_driver: str = Field(..., description="JDBC driver class name")
     db_user: str = Field(..., description="Database username")
@@ -302,181 +202,1366 @@ class CreateDatasourceInput(BaseModel):
     min_capacity: Optional[int] = Field(default=1, description="Minimum pool capacity", ge=0, le=100)
     max_capacity: Optional[int] = Field(default=15, description="Maximum pool capacity", ge=1, le=500)
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class JMSInput(BaseModel):
+class JMSInput(_AuthBase):
     '''Input model for JMS operations.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
+class DomainSnapshotInput(_AuthBase):
+    '''Input model for the composite domain snapshot.'''
+    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
 
-class ExecuteScriptInput(BaseModel):
+class ExecuteScriptInput(_AuthBase):
     '''Input model for executing custom WLST scripts.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided. Optional for offline scripts.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    script: str = Field(..., description="WLST/Jython script to execute", min_length=1)
+    script: str = Field(..., description="WLST/Jython script to execute", min_length=1, max_length=1_000_000)
     timeout: Optional[int] = Field(default=DEFAULT_TIMEOUT, description="Script execution timeout", ge=10, le=1800)
 
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
-
-class ThreadDumpInput(BaseModel):
+class ThreadDumpInput(_AuthBase):
     '''Input model for thread dump.'''
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True, extra='forbid')
-
-    admin_url: Optional[str] = Field(default=None, description="Admin Server URL. Uses WLST_ADMIN_URL env var if not provided.")
-    username: Optional[str] = Field(default=None, description="WebLogic admin username. Uses WLST_USERNAME env var if not provided.")
-    password: Optional[str] = Field(default=None, description="WebLogic admin password. Uses WLST_PASSWORD env var if not provided.")
-    server_name: str = Field(..., description="Server name to get thread dump from")
-
-    def get_admin_url(self) -> str:
-        return self.admin_url or DEFAULT_ADMIN_URL
-
-    def get_username(self) -> str:
-        return self.username or DEFAULT_USERNAME
-
-    def get_password(self) -> str:
-        return self.password or DEFAULT_PASSWORD
+    server_name: _StrippedStr = Field(..., description="Server name to get thread dump from")
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+# Resolved once at import; WEBLOGIC_HOME and WLST_PATH are read from the
+# environment at startup and do not change afterwards.
+_WLST_EXECUTABLE = (
+    os.path.join(WEBLOGIC_HOME, "oracle_common", "common", "bin",
+                 "wlst.cmd" if os.name == "nt" else "wlst.sh")
+    if WEBLOGIC_HOME else WLST_PATH
+)
+
+# Snapshot the worker environment once; {**os.environ, ...} is an
+# O(len(environ)) dict copy that does not belong on the spawn path.
+_WLST_ENV = {**os.environ, 'WLST_PROPERTIES': '-Dweblogic.security.SSL.ignoreHostnameVerification=true'}
+
 def _get_wlst_path() -> str:
     '''Get the full path to WLST executable.'''
-    if WEBLOGIC_HOME:
-        if os.name == "nt":
-            return os.path.join(WEBLOGIC_HOME, "oracle_common", "common", "bin", "wlst.cmd")
-        else:
-            return os.path.join(WEBLOGIC_HOME, "oracle_common", "common", "bin", "wlst.sh")
-    return WLST_PATH
+    return _WLST_EXECUTABLE
 
-async def _execute_wlst_script(script: str, timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
-    '''Execute a WLST script and return the output.'''
-    wlst_path = _get_wlst_path()
-
-    # Create temporary script file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as f:
-        f.write(script)
-        script_path = f.name
+# =============================================================================
+# WLST Worker Pool
+# =============================================================================
 
+# Interactive driver script run inside each pooled WLST process. It reads
+# framed 'EXEC <length> <job_id>' blocks from stdin, executes them in a shared
+# namespace (so the JVM and any WLST state survive between jobs), and marks
+# the end of each job's output with a sentinel line.
+_WORKER_DRIVER = '''
+import sys
+_code_cache = {}
+print('<<<WLST_READY>>>')
+sys.stdout.flush()
+while True:
+    header = sys.stdin.readline()
+    if not header:
+        break
+    header = header.strip()
+    if not header.startswith('EXEC '):
+        continue
+    try:
+        _, length, job_id = header.split(' ', 2)
+        body = sys.stdin.read(int(length))
+    except Exception:
+        break
     try:
-        # Execute WLST script
-        process = await asyncio.create_subprocess_exec(
-            wlst_path, script_path,
+        # Tool scripts are a small fixed set of templates, so the same body
+        # repeats constantly; cache the compiled code to skip re-parsing.
+        code = _code_cache.get(body)
+        if code is None:
+            if len(_code_cache) >= 64:
+                _code_cache.clear()
+            code = compile(body, '<wlst-job>', 'exec')
+            _code_cache[body] = code
+        exec(code)
+    except SystemExit:
+        pass
+    except Exception as e:
+        print('SCRIPT_ERROR: ' + str(e))
+    print('<<<WLST_END ' + job_id + '>>>')
+    sys.stdout.flush()
+'''
+
+# Timestamp of the last successful operation per (admin_url, username); a
+# worker bound to a key inside this TTL skips the connect preamble entirely.
+_last_ok: Dict[tuple, float] = {}
+
+# The driver is the only script that ever touches disk; per-call scripts are
+# piped straight to the worker's stdin. Written lazily once and shared by
+# every worker spawn.
+_driver_path: Optional[str] = None
+
+def _get_driver_path() -> str:
+    '''Return the path of the shared worker driver script, writing it once.'''
+    global _driver_path
+    if _driver_path is None or not os.path.exists(_driver_path):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as f:
+            f.write(_WORKER_DRIVER)
+            _driver_path = f.name
+        atexit.register(_cleanup_driver_file)
+    return _driver_path
+
+def _cleanup_driver_file() -> None:
+    '''Remove the shared driver script at interpreter shutdown.'''
+    if _driver_path is not None:
+        try:
+            os.unlink(_driver_path)
+        except OSError:
+            pass
+
+class WlstWorker:
+    '''A single long-lived WLST process accepting framed scripts over stdin.'''
+
+    def __init__(self, wlst_path: str):
+        self.wlst_path = wlst_path
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.alive = False
+        # (admin_url, username) this worker currently holds a live session for
+        self.current_conn: Optional[tuple] = None
+        self.last_used = 0.0
+
+    async def start(self) -> None:
+        '''Spawn the WLST process and wait for the driver to come up.'''
+        self.process = await asyncio.create_subprocess_exec(
+            self.wlst_path, _get_driver_path(),
+            stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env={**os.environ, 'WLST_PROPERTIES': '-Dweblogic.security.SSL.ignoreHostnameVerification=true'}
+            stderr=asyncio.subprocess.STDOUT,
+            env=_WLST_ENV,
+            # Skip the per-spawn FD-table scan; we only ever spawn a handful
+            # of long-lived workers and pass no inherited descriptors.
+            close_fds=False,
+            # A *_JSON marker line can easily exceed the 64 KB StreamReader
+            # default, which would make readline() raise mid-job; size the
+            # buffer to the same cap we enforce on total output.
+            limit=MAX_OUTPUT_BYTES,
+            # Own session/process group: wlst.sh is a shell wrapper around
+            # the JVM, so teardown must be able to signal the whole group
+            # or a hung JVM survives as an orphan.
+            start_new_session=True
         )
 
+        # Drain the WLST startup banner until the driver signals readiness
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout
-            )
+            while True:
+                line = await asyncio.wait_for(
+                    self.process.stdout.readline(),
+                    timeout=WORKER_STARTUP_TIMEOUT
+                )
+                if not line:
+                    raise RuntimeError("WLST worker exited during startup")
+                if b'<<<WLST_READY>>>' in line:
+                    break
         except asyncio.TimeoutError:
-            process.kill()
+            await self.kill()
+            raise RuntimeError(f"WLST worker did not start within {WORKER_STARTUP_TIMEOUT} seconds")
+
+        self.alive = True
+        self.last_used = time.monotonic()
+
+    async def ping(self, timeout: float = 10.0) -> bool:
+        '''Cheap liveness probe: run a print round-trip through the driver.'''
+        saved_conn = self.current_conn
+        try:
+            result = await self.run("print('PONG')", timeout=timeout)
+        except Exception:
+            await self.kill()
+            return False
+        if result['success'] and 'PONG' in result['stdout']:
+            # run() without conn clears the binding; the probe does not touch it
+            self.current_conn = saved_conn
+            return True
+        return False
+
+    async def run(self, script: Union[str, Sequence[str]], timeout: int = DEFAULT_TIMEOUT,
+                  conn: Optional[tuple] = None) -> Dict[str, Any]:
+        '''Execute a script on this worker and return the output.
+
+        script may be one string or a sequence of fragments (str or
+        pre-encoded bytes); fragments are written to the worker's stdin
+        individually, so a large body is never concatenated into a second
+        full-size buffer here.
+
+        When conn=(admin_url, username, password) is given, a connect preamble
+        is prepended only if this worker is not already bound to that
+        (admin_url, username) pair; the session is kept open between calls to
+        amortize the T3 handshake across many operations.
+        '''
+        parts = [script] if isinstance(script, str) else list(script)
+        if conn is not None:
+            key = (conn[0], conn[1])
+            # Re-emit the connect preamble when the binding changed or the
+            # last confirmed success for this domain is older than CONN_TTL
+            fresh = time.monotonic() - _last_ok.get(key, 0.0) < CONN_TTL
+            if self.current_conn != key or not fresh:
+                preamble = [_build_connect_bytes(conn[0], conn[1], conn[2])]
+                if self.current_conn:
+                    preamble.insert(0, _DISCONNECT_BYTES)
+                parts = preamble + parts
+        else:
+            # A raw script may connect/disconnect on its own; assume nothing
+            self.current_conn = None
+
+        job_id = uuid.uuid4().hex
+        payloads = [p if isinstance(p, bytes) else p.encode('utf-8') for p in parts]
+        sentinel = f'<<<WLST_END {job_id}>>>'.encode('utf-8')
+
+        stdin = self.process.stdin
+        stdin.write(f'EXEC {sum(len(b) for b in payloads)} {job_id}\n'.encode('utf-8'))
+        for b in payloads:
+            stdin.write(b)
+        await stdin.drain()
+
+        buf = bytearray()
+        markers: Dict[str, str] = {}
+        conn_error = False
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                await self.kill()
+                return {
+                    "success": False,
+                    "error": f"Script execution timed out after {timeout} seconds",
+                    "stdout": "",
+                    "stderr": ""
+                }
+            try:
+                line = await asyncio.wait_for(self.process.stdout.readline(), timeout=remaining)
+            except asyncio.TimeoutError:
+                await self.kill()
+                return {
+                    "success": False,
+                    "error": f"Script execution timed out after {timeout} seconds",
+                    "stdout": "",
+                    "stderr": ""
+                }
+            if not line:
+                await self.kill()
+                return {
+                    "success": False,
+                    "error": "WLST worker exited unexpectedly",
+                    "stdout": buf.decode('utf-8', errors='replace'),
+                    "stderr": ""
+                }
+            if sentinel in line:
+                break
+            buf.extend(line)
+            if len(buf) > MAX_OUTPUT_BYTES:
+                await self.kill()
+                return {
+                    "success": False,
+                    "error": f"Script output exceeded {MAX_OUTPUT_BYTES} bytes",
+                    "stdout": "",
+                    "stderr": ""
+                }
+            # Capture marker lines as they arrive, so neither this method nor
+            # the tools have to re-walk the buffered output afterwards
+            m = _MARKERS_RE.match(line.decode('utf-8', errors='replace'))
+            if m:
+                markers.setdefault(m.group(1), m.group(2).rstrip('\r'))
+                if m.group(1) == 'CONNECTION_ERROR':
+                    conn_error = True
+
+        stdout_str = buf.decode('utf-8', errors='replace')
+        failed = conn_error or 'SCRIPT_ERROR' in markers
+        error = None
+        if failed:
+            name = 'SCRIPT_ERROR' if 'SCRIPT_ERROR' in markers else 'CONNECTION_ERROR'
+            detail = markers.get(name, '')
+            error = f'{name}: {detail}' if detail else name
+
+        if conn_error:
+            self.current_conn = None
+            if conn is not None:
+                _last_ok.pop((conn[0], conn[1]), None)
+        elif conn is not None:
+            self.current_conn = (conn[0], conn[1])
+            if not failed:
+                _last_ok[self.current_conn] = time.monotonic()
+
+        self.last_used = time.monotonic()
+        return {
+            "success": not failed,
+            "returncode": 0 if not failed else 1,
+            "stdout": stdout_str,
+            # The undecoded buffer, for tools that slice out a large span
+            # (thread dumps) without paying for a second full decode
+            "stdout_bytes": buf,
+            "stderr": "",
+            "error": error,
+            "markers": markers
+        }
+
+    def _signal_group(self, sig: int) -> bool:
+        '''Signal the worker's whole process group.
+
+        The worker was started in its own session, so its group id is its
+        pid; this reaches the JVM even though wlst.sh sits between us and
+        it. Returns False if group signalling is unavailable so the caller
+        can fall back to signalling the direct child.
+        '''
+        try:
+            os.killpg(self.process.pid, sig)
+            return True
+        except (OSError, AttributeError):
+            return False
+
+    async def kill(self) -> None:
+        '''Terminate the worker process.
+
+        Escalates terminate -> short grace -> kill and always reaps the
+        child, so a timed-out worker never lingers as a zombie holding its
+        pool slot, and drains any buffered stdout so the kernel pipe buffer
+        cannot wedge a future writer.
+        '''
+        self.alive = False
+        if self.process is None or self.process.returncode is not None:
+            return
+        if not self._signal_group(signal.SIGTERM):
+            try:
+                self.process.terminate()
+            except ProcessLookupError:
+                return
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            if not self._signal_group(signal.SIGKILL):
+                try:
+                    self.process.kill()
+                except ProcessLookupError:
+                    pass
+            await self.process.wait()
+        try:
+            await asyncio.wait_for(self.process.stdout.read(MAX_OUTPUT_BYTES), timeout=1.0)
+        except Exception:
+            pass
+
+class WlstWorkerPool:
+    '''Pool of pre-warmed WLST worker processes.
+
+    Spawning a WLST process means booting a JVM (seconds); keeping a fixed set
+    of long-lived workers and dispatching scripts to them over stdin/stdout
+    amortizes that cost across all tool invocations.
+    '''
+
+    def __init__(self, size: int = POOL_SIZE):
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._spawned = 0
+        self._lock = asyncio.Lock()
+
+    async def _acquire(self, key: Optional[tuple] = None) -> WlstWorker:
+        '''Get an idle worker, spawning a new one if the pool is not full.
+
+        Prefers a worker already bound to the requested (admin_url, username)
+        key so its live session can be reused.
+        '''
+        if key is not None:
+            matched = None
+            others = []
+            while True:
+                try:
+                    candidate = self._idle.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if not candidate.alive:
+                    self._spawned -= 1
+                    continue
+                if matched is None and candidate.current_conn == key:
+                    matched = candidate
+                else:
+                    others.append(candidate)
+            for candidate in others:
+                self._idle.put_nowait(candidate)
+            if matched is not None:
+                if await self._validate(matched):
+                    return matched
+                self._spawned -= 1
+
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                worker = None
+
+            if worker is None:
+                async with self._lock:
+                    if self._spawned < self.size:
+                        self._spawned += 1
+                        try:
+                            worker = WlstWorker(_get_wlst_path())
+                            await worker.start()
+                        except Exception:
+                            self._spawned -= 1
+                            raise
+                        return worker
+                worker = await self._idle.get()
+
+            if worker.alive and await self._validate(worker):
+                return worker
+            async with self._lock:
+                self._spawned -= 1
+
+    async def _validate(self, worker: WlstWorker) -> bool:
+        '''Check an idle worker before reuse.
+
+        Workers idle past WORKER_IDLE_TIMEOUT are evicted outright; workers
+        idle past CONN_TTL get a ping round-trip so a dead JVM is replaced
+        instead of failing the caller's script.
+        '''
+        idle_for = time.monotonic() - worker.last_used
+        if idle_for > WORKER_IDLE_TIMEOUT:
+            await worker.kill()
+            return False
+        if idle_for > CONN_TTL and not await worker.ping():
+            return False
+        return True
+
+    def _release(self, worker: WlstWorker) -> None:
+        '''Return a worker to the pool, or drop it if it died.'''
+        if worker.alive:
+            self._idle.put_nowait(worker)
+        else:
+            self._spawned -= 1
+
+    async def execute(self, script: Union[str, Sequence[str]], timeout: int = DEFAULT_TIMEOUT,
+                      conn: Optional[tuple] = None) -> Dict[str, Any]:
+        '''Run a script on an idle worker.'''
+        key = (conn[0], conn[1]) if conn is not None else None
+        try:
+            worker = await self._acquire(key)
+        except (OSError, RuntimeError) as e:
             return {
                 "success": False,
-                "error": f"Script execution timed out after {timeout} seconds",
+                "error": f"Failed to start WLST worker: {e}",
                 "stdout": "",
                 "stderr": ""
             }
+        try:
+            return await worker.run(script, timeout, conn=conn)
+        finally:
+            self._release(worker)
 
-        stdout_str = stdout.decode('utf-8', errors='replace')
-        stderr_str = stderr.decode('utf-8', errors='replace')
+_pool = WlstWorkerPool()
 
-        return {
-            "success": process.returncode == 0,
-            "returncode": process.returncode,
-            "stdout": stdout_str,
-            "stderr": stderr_str,
-            "error": stderr_str if process.returncode != 0 else None
-        }
-    finally:
-        # Clean up temporary file
+async def _execute_wlst_script(script: Union[str, Sequence[str]], timeout: int = DEFAULT_TIMEOUT,
+                               conn: Optional[tuple] = None) -> Dict[str, Any]:
+    '''Execute a WLST script on a pooled worker and return the output.
+
+    Pass conn=(admin_url, username, password) to run the script against a
+    live session; the connect preamble is only emitted when the worker is
+    not already bound to that domain.
+    '''
+    return await _pool.execute(script, timeout, conn=conn)
+
+def _conn(params) -> tuple:
+    '''Build the (admin_url, username, password) tuple for a tool call.'''
+    return (params.get_admin_url(), params.get_username(), params.get_password())
+
+class WlstBatcher:
+    '''Coalesces concurrent scripts for the same domain into one WLST run.
+
+    MCP clients often fire several read-only tools back-to-back; requests
+    arriving within a short window that target the same (admin_url, username)
+    are concatenated with split markers, executed in a single WLST
+    invocation, and the output is divided back up per request.
+    '''
+
+    def __init__(self, max_batch: int = BATCH_MAX, window_ms: int = BATCH_WINDOW_MS):
+        self.max_batch = max_batch
+        self.window = window_ms / 1000.0
+        self._pending: Dict[tuple, list] = {}
+        self._dispatchers: Dict[tuple, asyncio.Task] = {}
+        # One batch in flight per key at a time, so concurrent dispatch
+        # rounds cannot race each other onto different workers
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+
+    async def submit(self, script: str, timeout: int, conn: tuple) -> Dict[str, Any]:
+        '''Queue a script for batched execution and wait for its result.'''
+        key = (conn[0], conn[1])
+        future = asyncio.get_event_loop().create_future()
+        self._pending.setdefault(key, []).append((script, timeout, conn, future))
+        if key not in self._dispatchers:
+            self._dispatchers[key] = asyncio.create_task(self._dispatch(key))
+        return await future
+
+    async def _dispatch(self, key: tuple) -> None:
+        '''Wait out the coalescing window, then run the queued scripts.'''
+        await asyncio.sleep(self.window)
+        entries = self._pending.pop(key, [])
+        self._dispatchers.pop(key, None)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            for start in range(0, len(entries), self.max_batch):
+                await self._run_batch(entries[start:start + self.max_batch])
+
+    async def _run_batch(self, entries: list) -> None:
+        '''Execute a group of scripts in one WLST invocation and split results.'''
         try:
-            os.unlink(script_path)
-        except:
+            if len(entries) == 1:
+                script, timeout, conn, future = entries[0]
+                result = await _pool.execute(script, timeout, conn=conn)
+                if not future.done():
+                    future.set_result(result)
+                return
+
+            markers = [f'<<<SPLIT {uuid.uuid4().hex}>>>' for _ in entries[:-1]]
+            parts = []
+            for i, (script, _, _, _) in enumerate(entries):
+                parts.append(script)
+                if i < len(markers):
+                    parts.append(f"\nprint('{markers[i]}')\n")
+            timeout = max(entry[1] for entry in entries)
+            conn = entries[0][2]
+
+            # The fragments go to the worker's stdin as-is; no combined copy
+            result = await _pool.execute(parts, timeout, conn=conn)
+
+            if not result['success'] and not result['stdout']:
+                # Worker-level failure (spawn error, timeout): applies to all
+                for _, _, _, future in entries:
+                    if not future.done():
+                        future.set_result(result)
+                return
+
+            remaining = result['stdout']
+            for i, (_, _, _, future) in enumerate(entries):
+                if remaining is None:
+                    segment_result = {
+                        "success": False,
+                        "returncode": 1,
+                        "stdout": "",
+                        "stderr": "",
+                        "error": "Batched WLST script aborted before this operation",
+                        "markers": {}
+                    }
+                else:
+                    if i < len(markers):
+                        idx = remaining.find(markers[i])
+                        if idx != -1:
+                            segment = remaining[:idx]
+                            remaining = remaining[idx + len(markers[i]):]
+                        else:
+                            segment = remaining
+                            remaining = None
+                    else:
+                        segment = remaining
+                    # Markers captured during the read loop span the whole
+                    # batch; re-scan just this request's slice of the output
+                    segment_markers = _scan_markers(segment)
+                    failed = ('CONNECTION_ERROR' in segment_markers
+                              or 'SCRIPT_ERROR' in segment_markers)
+                    segment_result = {
+                        "success": not failed,
+                        "returncode": 0 if not failed else 1,
+                        "stdout": segment,
+                        "stderr": "",
+                        "error": None if not failed else "WLST script failed",
+                        "markers": segment_markers
+                    }
+                if not future.done():
+                    future.set_result(segment_result)
+        except Exception as e:
+            for _, _, _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+
+_batcher = WlstBatcher()
+
+async def _submit_wlst(script: str, timeout: int = DEFAULT_TIMEOUT,
+                       conn: Optional[tuple] = None) -> Dict[str, Any]:
+    '''Submit a read-only script, allowing it to be batched with others.
+
+    Mutating tools should call _execute_wlst_script directly so they never
+    share a WLST invocation with other operations.
+    '''
+    if conn is None:
+        return await _execute_wlst_script(script, timeout)
+    return await _batcher.submit(script, timeout, conn)
+
+class TTLCache:
+    '''Short-lived cache of listing-tool execution results.
+
+    Domain shape (servers, datasources, JMS resources, deployments) changes
+    on the order of minutes, so repeat calls within LIST_CACHE_TTL seconds
+    are answered from memory without touching WLST at all. A per-key lock
+    coalesces concurrent misses into a single fetch, and mutating tools drop
+    every entry for their admin URL so a fresh listing follows any change.
+    '''
+
+    def __init__(self, ttl: int = LIST_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[tuple, tuple] = {}
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+
+    async def get_or_fetch(self, key: tuple, fetch) -> Dict[str, Any]:
+        '''Return the cached result for key, fetching once on a miss.
+
+        fetch is an async callable producing an execution result dict; only
+        successful results are cached, so errors are retried on the next call.
+        '''
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            result = await fetch()
+            if result.get('success'):
+                self._entries[key] = (time.monotonic() + self.ttl, result)
+            return result
+
+    def invalidate_url(self, admin_url: str) -> None:
+        '''Drop every cached listing for a domain after a mutating operation.'''
+        for key in [k for k in self._entries if k[1] == admin_url]:
+            del self._entries[key]
+
+_list_cache = TTLCache()
+
+# httpx is optional; when present, read-only tools try the WebLogic REST
+# management API first (tens of milliseconds over a kept-alive socket) and
+# fall back to WLST when the endpoint is unreachable or unsupported.
+try:
+    import httpx as _httpx
+except ImportError:
+    _httpx = None
+
+REST_TIMEOUT = float(os.environ.get("WLST_REST_TIMEOUT", "10"))
+REST_CLIENT_IDLE = int(os.environ.get("WLST_REST_CLIENT_IDLE", "60"))
+
+def _rest_base(admin_url: str) -> str:
+    '''Map a t3/t3s admin URL onto its http/https management endpoint.'''
+    if admin_url.startswith('t3s://'):
+        return 'https://' + admin_url[6:]
+    if admin_url.startswith('t3://'):
+        return 'http://' + admin_url[5:]
+    return admin_url
+
+class RestClientPool:
+    '''One kept-alive httpx client per (admin_url, username).
+
+    Reusing the client keeps the TCP/TLS session open between tool calls,
+    so only the first REST request per domain pays a handshake. Clients
+    idle past REST_CLIENT_IDLE are closed on the next access, mirroring how
+    the WLST worker pool evicts on acquire rather than via a background
+    task; a 401 drops the client so stale credentials cannot pin a session.
+    '''
+
+    def __init__(self):
+        self._clients: Dict[tuple, list] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, admin_url: str, username: str, password: str):
+        '''Return a pooled client for the domain, creating one on demand.'''
+        key = (admin_url, username)
+        now = time.monotonic()
+        async with self._lock:
+            for stale in [k for k, (_, t) in self._clients.items()
+                          if now - t > REST_CLIENT_IDLE]:
+                await self._close(self._clients.pop(stale)[0])
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry[1] = now
+                return entry[0]
+            client = _httpx.AsyncClient(
+                base_url=_rest_base(admin_url),
+                auth=(username, password),
+                timeout=REST_TIMEOUT,
+                limits=_httpx.Limits(max_connections=20, max_keepalive_connections=20,
+                                     keepalive_expiry=30),
+                headers={'Accept': 'application/json'}
+            )
+            self._clients[key] = [client, now]
+            return client
+
+    async def invalidate(self, admin_url: str, username: str) -> None:
+        '''Close and drop the client for a domain (e.g. after a 401).'''
+        async with self._lock:
+            entry = self._clients.pop((admin_url, username), None)
+        if entry is not None:
+            await self._close(entry[0])
+
+    @staticmethod
+    async def _close(client) -> None:
+        try:
+            await client.aclose()
+        except Exception:
             pass
 
-def _build_connect_script(admin_url: str, username: str, password: str) -> str:
-    '''Build WLST connect script fragment.'''
-    return f'''
+_rest_clients = RestClientPool()
+
+async def _rest_get(params, path: str) -> Optional[Dict[str, Any]]:
+    '''GET a management-API resource for a tool call.
+
+    Returns the parsed JSON body, or None for any failure — callers treat
+    None as "use the WLST path" so REST stays a pure fast path.
+    '''
+    if _httpx is None:
+        return None
+    admin_url = params.get_admin_url()
+    username = params.get_username()
+    try:
+        client = await _rest_clients.get(admin_url, username, params.get_password())
+        resp = await client.get(path)
+        if resp.status_code == 401:
+            await _rest_clients.invalidate(admin_url, username)
+            return None
+        if resp.status_code != 200:
+            return None
+        return _loads(resp.content)
+    except Exception:
+        return None
+
+async def _rest_metrics(params) -> Optional[Dict[str, Any]]:
+    '''Collect the server-metrics sections over REST; None to fall back.'''
+    base = f'/management/weblogic/latest/domainRuntime/serverRuntimes/{params.server_name}'
+    metrics: Dict[str, Any] = {'server': params.server_name}
+
+    if params.metric_type in ('all', 'jvm'):
+        data = await _rest_get(params, base + '/JVMRuntime?links=none'
+                               '&fields=heapSizeCurrent,heapSizeMax,heapFreeCurrent,heapFreePercent,uptime')
+        if data is None:
+            return None
+        metrics['jvm'] = {k: data.get(k) for k in
+                          ('heapSizeCurrent', 'heapSizeMax', 'heapFreeCurrent', 'heapFreePercent', 'uptime')}
+
+    if params.metric_type in ('all', 'threads'):
+        data = await _rest_get(params, base + '/threadPoolRuntime?links=none'
+                               '&fields=executeThreadTotalCount,executeThreadIdleCount,hoggingThreadCount,'
+                               'pendingUserRequestCount,queueLength')
+        if data is None:
+            return None
+        metrics['threads'] = {k: data.get(k) for k in
+                              ('executeThreadTotalCount', 'executeThreadIdleCount', 'hoggingThreadCount',
+                               'pendingUserRequestCount', 'queueLength')}
+
+    if params.metric_type in ('all', 'jdbc'):
+        data = await _rest_get(params, base + '/JDBCServiceRuntime/JDBCDataSourceRuntimeMBeans?links=none'
+                               '&fields=name,state,activeConnectionsCurrentCount,activeConnectionsHighCount,'
+                               'connectionsTotalCount,waitingForConnectionCurrentCount')
+        if data is None:
+            return None
+        metrics['jdbc'] = [{k: item.get(k) for k in
+                            ('name', 'state', 'activeConnectionsCurrentCount', 'activeConnectionsHighCount',
+                             'connectionsTotalCount', 'waitingForConnectionCurrentCount')}
+                           for item in data.get('items', [])]
+
+    return metrics
+
+# Static connect template; credentials are substituted as repr()-quoted
+# Python literals so quotes or backslashes in a password cannot break (or
+# alter) the generated Jython. On failure the error is re-raised so the rest
+# of the script is skipped; the pooled worker driver catches it and keeps
+# the JVM alive (calling exit() here would tear down the whole worker).
+_CONNECT_TMPL = '''
 try:
-    connect('{username}', '{password}', '{admin_url}')
+    connect(%s, %s, %s)
 except Exception as e:
     print('CONNECTION_ERROR: ' + str(e))
-    exit(1)
+    raise
 '''
 
-def _build_disconnect_script() -> str:
-    '''Build WLST disconnect script fragment.'''
-    return '''
+@functools.lru_cache(maxsize=256)
+def _build_connect_script(admin_url: str, username: str, password: str) -> str:
+    '''Build WLST connect script fragment (memoized per credential set).'''
+    return _CONNECT_TMPL % (repr(username), repr(password), repr(admin_url))
+
+def _pylit(value) -> str:
+    '''Render a value as a quoted Jython literal for script substitution.
+
+    repr() escapes quotes and backslashes, so a name or path containing a
+    single quote becomes a valid literal instead of breaking the script.
+    '''
+    return 'None' if value is None else repr(value)
+
+_DISCONNECT_SCRIPT = '''
 try:
     disconnect()
 except:
     pass
 '''
 
+# Pre-encoded fragments fed straight to the worker's stdin, skipping a
+# UTF-8 encode of the same boilerplate on every rebind
+_DISCONNECT_BYTES = _DISCONNECT_SCRIPT.encode('utf-8')
+
+@functools.lru_cache(maxsize=256)
+def _build_connect_bytes(admin_url: str, username: str, password: str) -> bytes:
+    '''Encoded connect fragment (memoized per credential set).'''
+    return _build_connect_script(admin_url, username, password).encode('utf-8')
+
 def _handle_error(result: Dict[str, Any]) -> str:
     '''Handle WLST execution errors and return formatted message.'''
-    if 'CONNECTION_ERROR' in result.get('stdout', ''):
-        error_line = [l for l in result['stdout'].split('\n') if 'CONNECTION_ERROR' in l]
-        return f"Error: Connection failed. {error_line[0] if error_line else 'Check credentials and URL.'}"
+    stdout = result.get('stdout', '')
+    idx = stdout.find('CONNECTION_ERROR')
+    if idx != -1:
+        # Slice out just the offending line instead of splitting all of stdout
+        end = stdout.find('\n', idx)
+        error_line = stdout[idx:end if end != -1 else None]
+        return f"Error: Connection failed. {error_line or 'Check credentials and URL.'}"
     if result.get('error'):
         return f"Error: {result['error']}"
     return "Error: Unknown error occurred during WLST execution"
 
+# Single compiled pass over WLST stdout collecting 'MARKER: payload' lines.
+# Tools used to re-split and re-scan the whole buffer once per marker; this
+# materializes no list of lines and visits the output exactly once.
+_MARKERS_RE = re.compile(
+    r'^(CONNECTION_SUCCESS|DOMAIN_NAME|DOMAIN_VERSION'
+    r'|SERVERS_JSON|APPS_JSON|HEALTH_JSON|METRICS_JSON|DS_JSON|JMS_JSON'
+    r'|SERVER_STARTED|SERVER_STOPPED|SERVER_RESTARTED|SERVER_ALREADY_STOPPED'
+    r'|SERVER_UNKNOWN_STATE|SERVER_STATE'
+    r'|DEPLOY_SUCCESS|UNDEPLOY_SUCCESS|START_SUCCESS|STOP_SUCCESS|REDEPLOY_SUCCESS'
+    r'|\w+_ERROR):? ?(.*)$',
+    re.M
+)
+
+def _scan_markers(stdout: str) -> Dict[str, str]:
+    '''Collect all marker lines from WLST output in one pass.
+
+    Returns a dict of marker name to payload (text after the colon); the
+    first occurrence of each marker wins.
+    '''
+    markers: Dict[str, str] = {}
+    for m in _MARKERS_RE.finditer(stdout):
+        markers.setdefault(m.group(1), m.group(2))
+    return markers
+
+def _result_markers(result: Dict[str, Any]) -> Dict[str, str]:
+    '''Return the markers for an execution result.
+
+    Workers capture markers incrementally while streaming stdout; fall back
+    to a full scan only for results that predate that capture (e.g. timeout
+    stubs).
+    '''
+    markers = result.get('markers')
+    if markers is None:
+        markers = _scan_markers(result.get('stdout') or '')
+    return markers
+
+# orjson is optional; it parses and serializes JSON several times faster
+# than the stdlib, which matters for large metrics/thread-dump payloads.
+try:
+    import orjson as _orjson
+
+    def _loads(s):
+        return _orjson.loads(s)
+
+    def _dumps(obj) -> str:
+        return _orjson.dumps(obj).decode()
+
+    def _dumps_pretty(obj) -> str:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _orjson = None
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+_JSON_DECODER = json.JSONDecoder()
+
 def _parse_json_output(output: str) -> Optional[Dict]:
-    '''Parse JSON output from WLST script.'''
-    try:
-        # Find JSON block in output
-        lines = output.split('\n')
-        json_lines = []
-        in_json = False
-
-        for line in lines:
-            if line.strip().startswith('{') or line.strip().startswith('['):
-                in_json = True
-            if in_json:
-                json_lines.append(line)
-            if in_json and (line.strip().endswith('}') or line.strip().endswith(']')):
-                break
+    '''Parse the first JSON value found in WLST script output.
+
+    raw_decode finds the end of the value natively, so nested multi-line
+    JSON is handled in a single O(n) pass without materializing a list of
+    lines.
+    '''
+    obj_start = output.find('{')
+    arr_start = output.find('[')
+    if obj_start == -1:
+        start = arr_start
+    elif arr_start == -1:
+        start = obj_start
+    else:
+        start = min(obj_start, arr_start)
+    if start == -1:
+        return None
 
-        if json_lines:
-            return json.loads('\n'.join(json_lines))
+    try:
+        value, _ = _JSON_DECODER.raw_decode(output, start)
+        return value
     except json.JSONDecodeError:
+        return None
+
+# =============================================================================
+# WLST Script Templates
+# =============================================================================
+
+# Per-tool Jython bodies, built once at import. Static bodies are plain
+# constants; parameterized ones are string.Templates so only the handful of
+# substituted values is formatted per call. The connect preamble is handled
+# by the worker dispatch path and never appears here.
+
+_SCRIPT_TEST_CONNECTION = '''
+domainName = cmo.getName()
+domainVersion = cmo.getDomainVersion()
+print('CONNECTION_SUCCESS')
+print('DOMAIN_NAME: ' + str(domainName))
+print('DOMAIN_VERSION: ' + str(domainVersion))
+'''
+
+_SCRIPT_LIST_SERVERS = '''
+import json
+
+servers = []
+domainRuntime()
+
+# One bulk call returns every lifecycle bean; no per-server ls/lookup
+for mb in cmo.getServerLifeCycleRuntimes():
+    name = str(mb.getName())
+    try:
+        servers.append({'name': name, 'state': str(mb.getState())})
+    except Exception as e:
+        servers.append({'name': name, 'state': 'ERROR: ' + str(e)})
+
+print('SERVERS_JSON:' + json.dumps(servers))
+'''
+
+_TMPL_START_SERVER = string.Template('''
+
+try:
+    serverName = ${server}
+    start(serverName, 'Server')
+    print('SERVER_STARTED: ' + serverName)
+except Exception as e:
+    print('START_ERROR: ' + str(e))
+
+''')
+
+_TMPL_STOP_SERVER = string.Template('''
+
+try:
+    serverName = ${server}
+    domainRuntime()
+    serverState = str(getMBean('/ServerLifeCycleRuntimes/' + serverName).getState())
+    print('SERVER_STATE: ' + serverState)
+
+    if serverState == 'SHUTDOWN':
+        print('SERVER_ALREADY_STOPPED: ' + serverName)
+    elif serverState in ['RUNNING', 'ADMIN', 'RESUMING']:
+        shutdown(serverName, 'Server', ignoreSessions='true', timeOut=90, force=${force})
+        print('SERVER_STOPPED: ' + serverName)
+    elif serverState in ['STARTING', 'STANDBY', 'SUSPENDING']:
+        shutdown(serverName, 'Server', ignoreSessions='true', timeOut=90, force='true')
+        print('SERVER_STOPPED: ' + serverName)
+    else:
+        print('SERVER_UNKNOWN_STATE: ' + serverState)
+except Exception as e:
+    print('STOP_ERROR: ' + str(e))
+
+''')
+
+_TMPL_RESTART_SERVER = string.Template('''
+
+try:
+    serverName = ${server}
+    shutdown(serverName, 'Server', ignoreSessions='true', timeOut=120, force=${force})
+    print('SERVER_STOPPED: ' + serverName)
+    start(serverName, 'Server')
+    print('SERVER_RESTARTED: ' + serverName)
+except Exception as e:
+    print('RESTART_ERROR: ' + str(e))
+
+''')
+
+_TMPL_DEPLOY = string.Template('''
+
+try:
+    appName = ${app}
+    deploy(appName, ${app_path}${targets_param}, stageMode=${stage_mode}${plan_param})
+    print('DEPLOY_SUCCESS: ' + appName)
+except Exception as e:
+    print('DEPLOY_ERROR: ' + str(e))
+
+''')
+
+_TMPL_UNDEPLOY = string.Template('''
+
+try:
+    appName = ${app}
+    undeploy(appName${targets_param})
+    print('UNDEPLOY_SUCCESS: ' + appName)
+except Exception as e:
+    print('UNDEPLOY_ERROR: ' + str(e))
+
+''')
+
+_TMPL_START_APP = string.Template('''
+
+try:
+    appName = ${app}
+    startApplication(appName)
+    print('START_SUCCESS: ' + appName)
+except Exception as e:
+    print('START_ERROR: ' + str(e))
+
+''')
+
+_TMPL_STOP_APP = string.Template('''
+
+try:
+    appName = ${app}
+    stopApplication(appName)
+    print('STOP_SUCCESS: ' + appName)
+except Exception as e:
+    print('STOP_ERROR: ' + str(e))
+
+''')
+
+_TMPL_REDEPLOY_APP = string.Template('''
+
+try:
+    appName = ${app}
+    redeploy(appName)
+    print('REDEPLOY_SUCCESS: ' + appName)
+except Exception as e:
+    print('REDEPLOY_ERROR: ' + str(e))
+
+''')
+
+_SCRIPT_LIST_APPS = '''
+import json
+
+apps = []
+
+# Get targets from serverConfig: one bulk call for all deployment beans
+serverConfig()
+appTargetsMap = {}
+appInfoMap = {}
+
+for app in cmo.getAppDeployments():
+    appName = str(app.getName())
+
+    targets = app.getTargets()
+    appTargetsMap[appName] = [str(t.getName()) for t in targets] if targets else []
+
+    appInfoMap[appName] = {
+        'moduleType': str(app.getModuleType()) if app.getModuleType() else 'unknown',
+        'sourcePath': str(app.getSourcePath()) if app.getSourcePath() else ''
+    }
+
+# Get runtime state from domainRuntime
+domainRuntime()
+appState = getMBean('/AppRuntimeStateRuntime/AppRuntimeStateRuntime')
+appNamesRaw = appState.getApplicationIds()
+appNamesList = list(appNamesRaw) if appNamesRaw else []
+
+for i in range(len(appNamesList)):
+    appName = str(appNamesList[i])
+    targetStates = []
+    targets = appTargetsMap.get(appName, [])
+
+    for j in range(len(targets)):
+        targetName = str(targets[j])
+        try:
+            state = appState.getCurrentState(appName, targetName)
+            targetStates.append({'target': targetName, 'state': str(state) if state else 'None'})
+        except:
+            targetStates.append({'target': targetName, 'state': 'UNKNOWN'})
+
+    intendedState = str(appState.getIntendedState(appName))
+    appInfo = appInfoMap.get(appName, {})
+    apps.append({
+        'name': appName,
+        'moduleType': appInfo.get('moduleType', 'unknown'),
+        'sourcePath': appInfo.get('sourcePath', ''),
+        'targets': targetStates,
+        'intendedState': intendedState
+    })
+
+print('APPS_JSON:' + json.dumps(apps))
+'''
+
+_TMPL_SERVER_HEALTH = string.Template('''
+import json
+from java.util.concurrent import Callable, Executors
+
+health_data = []
+domainRuntime()
+servers = ls('ServerRuntimes', returnMap='true')
+
+names = []
+for serverName in servers:
+    ${server_filter}
+        names.append(serverName)
+
+def collectHealth(serverName):
+    try:
+        mb = getMBean('/ServerRuntimes/' + serverName)
+        return {
+            'name': serverName,
+            'state': mb.getState(),
+            'health': str(mb.getHealthState()),
+            'openSocketsCurrentCount': mb.getOpenSocketsCurrentCount(),
+            'activationTime': str(mb.getActivationTime()) if mb.getActivationTime() else None
+        }
+    except Exception as e:
+        return {'name': serverName, 'state': 'ERROR: ' + str(e)}
+
+class HealthTask(Callable):
+    def __init__(self, serverName):
+        self.serverName = serverName
+    def call(self):
+        return collectHealth(self.serverName)
+
+if len(names) > 1:
+    # Absolute-path lookups share no cursor, so per-server reads are safe
+    # to run concurrently; latency drops from N x RTT to roughly one RTT
+    pool = Executors.newFixedThreadPool(min(8, len(names)))
+    try:
+        for future in pool.invokeAll([HealthTask(n) for n in names]):
+            health_data.append(future.get())
+    finally:
+        pool.shutdown()
+elif names:
+    health_data.append(collectHealth(names[0]))
+
+print('HEALTH_JSON:' + json.dumps(health_data))
+''')
+
+_TMPL_SERVER_METRICS = string.Template('''
+import json
+
+metrics = {'server': '${server_name}'}
+
+try:
+    domainRuntime()
+    serverPath = '/ServerRuntimes/${server_name}'
+
+    # JVM metrics
+    if '${metric_type}' in ['all', 'jvm']:
+        try:
+            jvm = getMBean(serverPath + '/JVMRuntime/${server_name}')
+            metrics['jvm'] = {
+                'heapSizeCurrent': jvm.getHeapSizeCurrent(),
+                'heapSizeMax': jvm.getHeapSizeMax(),
+                'heapFreeCurrent': jvm.getHeapFreeCurrent(),
+                'heapFreePercent': jvm.getHeapFreePercent(),
+                'uptime': jvm.getUptime()
+            }
+        except Exception as jvmEx:
+            metrics['jvm'] = {'error': str(jvmEx)}
+
+    # Thread metrics
+    if '${metric_type}' in ['all', 'threads']:
+        try:
+            tp = getMBean(serverPath + '/ThreadPoolRuntime/ThreadPoolRuntime')
+            metrics['threads'] = {
+                'executeThreadTotalCount': tp.getExecuteThreadTotalCount(),
+                'executeThreadIdleCount': tp.getExecuteThreadIdleCount(),
+                'hoggingThreadCount': tp.getHoggingThreadCount(),
+                'pendingUserRequestCount': tp.getPendingUserRequestCount(),
+                'queueLength': tp.getQueueLength()
+            }
+        except Exception as threadEx:
+            metrics['threads'] = {'error': str(threadEx)}
+
+    # JDBC metrics
+    if '${metric_type}' in ['all', 'jdbc']:
+        try:
+            jdbcService = getMBean(serverPath + '/JDBCServiceRuntime/${server_name}')
+            dsRuntimes = jdbcService.getJDBCDataSourceRuntimeMBeans()
+            jdbc_data = []
+            if dsRuntimes:
+                for ds in dsRuntimes:
+                    jdbc_data.append({
+                        'name': str(ds.getName()),
+                        'state': ds.getState(),
+                        'activeConnectionsCurrentCount': ds.getActiveConnectionsCurrentCount(),
+                        'activeConnectionsHighCount': ds.getActiveConnectionsHighCount(),
+                        'connectionsTotalCount': ds.getConnectionsTotalCount(),
+                        'waitingForConnectionCurrentCount': ds.getWaitingForConnectionCurrentCount()
+                    })
+            metrics['jdbc'] = jdbc_data
+        except Exception as jdbcEx:
+            metrics['jdbc'] = {'error': str(jdbcEx)}
+
+    print('METRICS_JSON:' + json.dumps(metrics))
+except Exception as e:
+    print('METRICS_ERROR: ' + str(e))
+
+''')
+
+_SCRIPT_LIST_DATASOURCES = '''
+import json
+
+datasources = []
+serverConfig()
+dsNames = ls('JDBCSystemResources', returnMap='true')
+
+for dsName in dsNames:
+    params = getMBean('/JDBCSystemResources/' + dsName + '/JDBCResource/' + dsName + '/JDBCDriverParams/' + dsName)
+    resource = getMBean('/JDBCSystemResources/' + dsName)
+    targets = resource.getTargets()
+
+    datasources.append({
+        'name': dsName,
+        'url': params.getUrl(),
+        'driver': params.getDriverName(),
+        'targets': [t.getName() for t in targets] if targets else []
+    })
+
+print('DS_JSON:' + json.dumps(datasources))
+'''
+
+_SCRIPT_LIST_JMS = '''
+import json
+
+jms_data = {'servers': [], 'modules': []}
+
+serverConfig()
+
+# JMS Servers
+jmsServers = ls('JMSServers', returnMap='true')
+for serverName in jmsServers:
+    mb = getMBean('/JMSServers/' + serverName)
+    targets = mb.getTargets()
+    targetNames = [t.getName() for t in targets] if targets else []
+    jms_data['servers'].append({'name': serverName, 'targets': targetNames})
+
+# JMS Modules
+modules = ls('JMSSystemResources', returnMap='true')
+for moduleName in modules:
+    module_data = {'name': moduleName, 'queues': [], 'topics': []}
+    resource = getMBean('/JMSSystemResources/' + moduleName + '/JMSResource/' + moduleName)
+
+    # Queues
+    try:
+        for queue in resource.getQueues():
+            module_data['queues'].append({'name': str(queue.getName()), 'jndiName': queue.getJNDIName()})
+    except:
+        pass
+
+    # Topics
+    try:
+        for topic in resource.getTopics():
+            module_data['topics'].append({'name': str(topic.getName()), 'jndiName': topic.getJNDIName()})
+    except:
         pass
-    return None
+
+    jms_data['modules'].append(module_data)
+
+print('JMS_JSON:' + json.dumps(jms_data))
+'''
+
+_TMPL_THREAD_DUMP = string.Template('''
+
+try:
+    serverRuntime()
+    cd('/ServerRuntimes/${server_name}')
+    threadDump = cmo.getThreadStackDump()
+    print('THREAD_DUMP_START')
+    print(threadDump)
+    print('THREAD_DUMP_END')
+except Exception as e:
+    print('THREAD_DUMP_ERROR: ' + str(e))
+
+''')
+
+# Static delimiters wrapped around user scripts in wlst_execute_script;
+# joining constants avoids re-rendering the boilerplate around what can be
+# a large script body on every call. Interned so comparisons and any
+# downstream hashing resolve by identity.
+_USER_SCRIPT_PRE = sys.intern('\n# User script starts here\n')
+_USER_SCRIPT_POST = sys.intern('\n# User script ends here\n')
+
+# Result framing for wlst_execute_script; stdout can be tens of KB, so the
+# return string is a join around it rather than an f-string re-copy.
+_OK_PRE = sys.intern("Script executed successfully:\n\n```\n")
+_OK_POST = sys.intern("\n```")
+_ERR_PRE = sys.intern("Script execution failed:\n\n**STDOUT:**\n```\n")
+_ERR_MID = sys.intern("\n```\n\n**STDERR:**\n```\n")
+_ERR_POST = sys.intern("\n```")
+
+# Head/tail shown inline when execute_script output is spilled to disk
+_SPILL_SNIPPET = 2048
+
+def _spill_output(stdout: str) -> str:
+    '''Persist oversized script output to a tempfile and return a summary.
+
+    Keeps the MCP response (and its JSON serialization) at snippet size
+    instead of shipping a multi-megabyte WLST dump inline.
+    '''
+    with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', prefix='wlst_output_',
+                                     suffix='.out', delete=False) as f:
+        f.write(stdout)
+        path = f.name
+    return ''.join((
+        "Script executed successfully. Output is ", str(len(stdout)),
+        " characters; full output saved to ", path, "\n\nFirst ",
+        str(_SPILL_SNIPPET), " characters:\n\n```\n", stdout[:_SPILL_SNIPPET],
+        "\n```\n\nLast ", str(_SPILL_SNIPPET), " characters:\n\n```\n",
+        stdout[-_SPILL_SNIPPET:], "\n```",
+    ))
+
+# Composite snapshot: the listing bodies are self-contained (absolute-path
+# lookups, distinct markers), so running them back-to-back in one WLST
+# invocation walks the MBean tree once per section over a single connection.
+# Metrics are per-server and stay with wlst_server_metrics.
+_SCRIPT_DOMAIN_SNAPSHOT = ''.join((
+    _SCRIPT_LIST_SERVERS,
+    _SCRIPT_LIST_APPS,
+    _TMPL_SERVER_HEALTH.substitute(server_filter='if True:'),
+    _SCRIPT_LIST_DATASOURCES,
+    _SCRIPT_LIST_JMS,
+))
+
+# State-to-emoji lookups for the Markdown formatters; a dict get is one hash
+# probe per row instead of chained string comparisons.
+_SERVER_STATE_EMOJI = {'RUNNING': '🟢', 'SHUTDOWN': '🔴'}
+_APP_STATE_EMOJI = {'STATE_ACTIVE': '🟢', 'STATE_PREPARED': '🔴'}
+
+# The nested listing formatters yield fragments consumed by a single
+# C-level ''.join, so no intermediate list of rows is ever materialized.
+
+def _render_applications(apps):
+    '''Yield Markdown fragments for the deployed-applications listing.'''
+    yield f"# Deployed Applications\n\n**Total applications**: {len(apps)}\n\n"
+    for app in apps:
+        # Use intendedState as the real indicator (getCurrentState has issues in WLS 14.x)
+        intended = app['intendedState']
+        yield f"## {_APP_STATE_EMOJI.get(intended, '🟡')} **{app['name']}**\n"
+        yield f"- **Type**: {app.get('moduleType', 'unknown')}\n"
+        yield f"- **State**: {intended}\n"
+        yield f"- **Targets**: {', '.join([t['target'] for t in app.get('targets', [])])}\n\n"
+
+def _render_datasources(datasources):
+    '''Yield Markdown fragments for the JDBC datasource listing.'''
+    yield f"# JDBC Datasources\n\n**Total**: {len(datasources)}\n\n"
+    for ds in datasources:
+        yield f"## {ds['name']}\n"
+        yield f"- **URL**: `{ds['url']}`\n"
+        yield f"- **Driver**: {ds['driver']}\n"
+        yield f"- **Targets**: {', '.join(ds['targets']) if ds['targets'] else 'None'}\n\n"
+
+def _render_jms(jms_data):
+    '''Yield Markdown fragments for the JMS resource listing.'''
+    yield "# JMS Resources\n\n## JMS Servers\n"
+    if jms_data['servers']:
+        for server in jms_data['servers']:
+            yield f"- **{server['name']}** → {', '.join(server['targets']) if server['targets'] else 'No targets'}\n"
+    else:
+        yield "- No JMS servers configured\n"
+    yield "\n## JMS Modules\n"
+    for module in jms_data['modules']:
+        yield f"### {module['name']}\n"
+        if module['queues']:
+            yield "**Queues:**\n"
+            for q in module['queues']:
+                yield f"- {q['name']} (`{q['jndiName']}`)\n"
+        if module['topics']:
+            yield "**Topics:**\n"
+            for t in module['topics']:
+                yield f"- {t['name']} (`{t['jndiName']}`)\n"
+        if not module['queues'] and not module['topics']:
+            yield "- No queues or topics\n"
+        yield "\n"
 
 # =============================================================================
 # Tool Implementations
@@ -508,22 +1593,19 @@ async def wlst_test_connection(params: ConnectionInput) -> str:
     Returns:
         str: Success message with domain info or error message
     '''
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-domainName = cmo.getName()
-domainVersion = cmo.getDomainVersion()
-print('CONNECTION_SUCCESS')
-print('DOMAIN_NAME: ' + str(domainName))
-print('DOMAIN_VERSION: ' + str(domainVersion))
-{_build_disconnect_script()}
-'''
+    data = await _rest_get(params, '/management/weblogic/latest/domainConfig?links=none&fields=name,domainVersion')
+    if data is not None and data.get('name'):
+        return f"Connection successful!\n\n- **Domain**: {data['name']}\n- **Version**: {data.get('domainVersion') or 'Unknown'}\n- **URL**: {params.get_admin_url()}"
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT)
+    script = _SCRIPT_TEST_CONNECTION
 
-    if result['success'] and 'CONNECTION_SUCCESS' in result['stdout']:
-        lines = result['stdout'].split('\n')
-        domain_name = next((l.replace('DOMAIN_NAME: ', '') for l in lines if 'DOMAIN_NAME:' in l), 'Unknown')
-        domain_version = next((l.replace('DOMAIN_VERSION: ', '') for l in lines if 'DOMAIN_VERSION:' in l), 'Unknown')
+    result = await _submit_wlst(script, params.timeout or DEFAULT_TIMEOUT, conn=_conn(params))
+
+    markers = _result_markers(result)
+
+    if result['success'] and 'CONNECTION_SUCCESS' in markers:
+        domain_name = markers.get('DOMAIN_NAME') or 'Unknown'
+        domain_version = markers.get('DOMAIN_VERSION') or 'Unknown'
         return f"Connection successful!\n\n- **Domain**: {domain_name}\n- **Version**: {domain_version}\n- **URL**: {params.get_admin_url()}"
 
     return _handle_error(result)
@@ -547,48 +1629,24 @@ async def wlst_list_servers(params: ListServersInput) -> str:
     Returns:
         str: List of servers in requested format (markdown or json)
     '''
-    script = f'''
-import json
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-servers = []
-domainRuntime()
-cd('ServerLifeCycleRuntimes')
-serverNamesRaw = ls(returnMap='true')
-
-# Handle both dict and list types returned by ls()
-if serverNamesRaw:
-    if hasattr(serverNamesRaw, 'keys'):
-        serverNames = list(serverNamesRaw.keys())
+    servers = []
+    data = await _rest_get(params, '/management/weblogic/latest/domainRuntime/serverLifeCycleRuntimes'
+                           '?links=none&fields=name,state')
+    if data is not None and 'items' in data:
+        servers = [{'name': item.get('name'), 'state': item.get('state')} for item in data['items']]
     else:
-        serverNames = list(serverNamesRaw)
-else:
-    serverNames = []
-
-for i in range(len(serverNames)):
-    name = str(serverNames[i])
-    try:
-        cd('/ServerLifeCycleRuntimes/' + name)
-        state = str(cmo.getState())
-        servers.append({{'name': name, 'state': state}})
-    except Exception as e:
-        servers.append({{'name': name, 'state': 'ERROR: ' + str(e)}})
-
-print('SERVERS_JSON:' + json.dumps(servers))
-{_build_disconnect_script()}
-'''
+        result = await _list_cache.get_or_fetch(
+            ('list_servers', params.get_admin_url(), params.get_username()),
+            lambda: _submit_wlst(_SCRIPT_LIST_SERVERS, conn=_conn(params)))
 
-    result = await _execute_wlst_script(script)
-
-    if not result['success']:
-        return _handle_error(result)
+        if not result['success']:
+            return _handle_error(result)
 
-    # Parse servers from output
-    servers = []
-    for line in result['stdout'].split('\n'):
-        if 'SERVERS_JSON:' in line:
+        # Parse servers from output
+        payload = _result_markers(result).get('SERVERS_JSON')
+        if payload:
             try:
-                servers = json.loads(line.replace('SERVERS_JSON:', ''))
+                servers = _loads(payload)
             except:
                 pass
 
@@ -596,15 +1654,16 @@ print('SERVERS_JSON:' + json.dumps(servers))
         return "No servers found or unable to parse server list."
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps({"servers": servers, "total": len(servers)}, indent=2)
+        return _dumps_pretty({"servers": servers, "total": len(servers)})
 
     # Markdown format
-    lines = ["# WebLogic Servers", "", f"**Total servers**: {len(servers)}", ""]
+    buf = io.StringIO()
+    buf.write(f"# WebLogic Servers\n\n**Total servers**: {len(servers)}\n\n")
     for server in servers:
-        state_emoji = "🟢" if server['state'] == 'RUNNING' else "🔴" if server['state'] == 'SHUTDOWN' else "🟡"
-        lines.append(f"- {state_emoji} **{server['name']}**: {server['state']}")
+        state_emoji = _SERVER_STATE_EMOJI.get(server['state'], '🟡')
+        buf.write(f"- {state_emoji} **{server['name']}**: {server['state']}\n")
 
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 @mcp.tool(
     name="wlst_start_server",
@@ -625,26 +1684,21 @@ async def wlst_start_server(params: ServerOperationInput) -> str:
     Returns:
         str: Operation result message
     '''
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
+    script = _TMPL_START_SERVER.substitute(server=_pylit(params.server_name))
 
-try:
-    start('{params.server_name}', 'Server')
-    print('SERVER_STARTED: {params.server_name}')
-except Exception as e:
-    print('START_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT, conn=conn)
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT)
+    markers = _result_markers(result)
 
-    if result['success'] and 'SERVER_STARTED' in result['stdout']:
+    if result['success'] and 'SERVER_STARTED' in markers:
         return f"Server **{params.server_name}** started successfully."
 
-    if 'START_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'START_ERROR' in l]
-        return f"Error starting server: {error_line[0].replace('START_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'START_ERROR' in markers:
+        return f"Error starting server: {markers['START_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -667,48 +1721,29 @@ async def wlst_stop_server(params: ServerOperationInput) -> str:
     Returns:
         str: Operation result message
     '''
-    force_param = ", force='true'" if params.force else ""
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-try:
-    domainRuntime()
-    cd('ServerLifeCycleRuntimes/{params.server_name}')
-    serverState = cmo.getState()
-    print('SERVER_STATE: ' + serverState)
+    script = _TMPL_STOP_SERVER.substitute(server=_pylit(params.server_name),
+                                          force=_pylit('true' if params.force else 'false'))
 
-    if serverState == 'SHUTDOWN':
-        print('SERVER_ALREADY_STOPPED: {params.server_name}')
-    elif serverState in ['RUNNING', 'ADMIN', 'RESUMING']:
-        shutdown('{params.server_name}', 'Server', ignoreSessions='true', timeOut=90{force_param})
-        print('SERVER_STOPPED: {params.server_name}')
-    elif serverState in ['STARTING', 'STANDBY', 'SUSPENDING']:
-        shutdown('{params.server_name}', 'Server', ignoreSessions='true', timeOut=90, force='true')
-        print('SERVER_STOPPED: {params.server_name}')
-    else:
-        print('SERVER_UNKNOWN_STATE: ' + serverState)
-except Exception as e:
-    print('STOP_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, params.timeout or DEFAULT_SHUTDOWN_TIMEOUT, conn=conn)
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_SHUTDOWN_TIMEOUT)
+    markers = _result_markers(result)
 
-    if result['success'] and 'SERVER_STOPPED' in result['stdout']:
+    if result['success'] and 'SERVER_STOPPED' in markers:
         return f"Server **{params.server_name}** stopped successfully."
 
-    if 'SERVER_ALREADY_STOPPED' in result['stdout']:
+    if 'SERVER_ALREADY_STOPPED' in markers:
         return f"Server **{params.server_name}** is already stopped."
 
-    if 'SERVER_UNKNOWN_STATE' in result['stdout']:
-        state_line = [l for l in result['stdout'].split('\n') if 'SERVER_STATE' in l]
-        state = state_line[0].replace('SERVER_STATE: ', '') if state_line else 'unknown'
+    if 'SERVER_UNKNOWN_STATE' in markers:
+        state = markers.get('SERVER_STATE', 'unknown')
         return f"Server **{params.server_name}** is in state **{state}** and cannot be stopped normally."
 
-    if 'STOP_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'STOP_ERROR' in l]
-        return f"Error stopping server: {error_line[0].replace('STOP_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'STOP_ERROR' in markers:
+        return f"Error stopping server: {markers['STOP_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -731,29 +1766,22 @@ async def wlst_restart_server(params: ServerOperationInput) -> str:
     Returns:
         str: Operation result message
     '''
-    force_param = ", force='true'" if params.force else ""
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
+    script = _TMPL_RESTART_SERVER.substitute(server=_pylit(params.server_name),
+                                             force=_pylit('true' if params.force else 'false'))
 
-try:
-    shutdown('{params.server_name}', 'Server', ignoreSessions='true', timeOut=120{force_param})
-    print('SERVER_STOPPED: {params.server_name}')
-    start('{params.server_name}', 'Server')
-    print('SERVER_RESTARTED: {params.server_name}')
-except Exception as e:
-    print('RESTART_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, params.timeout or DEFAULT_SHUTDOWN_TIMEOUT, conn=conn)
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_SHUTDOWN_TIMEOUT)
+    markers = _result_markers(result)
 
-    if result['success'] and 'SERVER_RESTARTED' in result['stdout']:
+    if result['success'] and 'SERVER_RESTARTED' in markers:
         return f"Server **{params.server_name}** restarted successfully."
 
-    if 'RESTART_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'RESTART_ERROR' in l]
-        return f"Error restarting server: {error_line[0].replace('RESTART_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'RESTART_ERROR' in markers:
+        return f"Error restarting server: {markers['RESTART_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -776,31 +1804,30 @@ async def wlst_deploy(params: DeployInput) -> str:
     Returns:
         str: Deployment result message
     '''
-    targets_param = f", targets='{params.targets}'" if params.targets else ""
-    plan_param = f", planPath='{params.plan_path.replace(chr(92), '/')}'" if params.plan_path else ""
-    # Convert backslashes to forward slashes for Windows path compatibility
-    app_path_safe = params.app_path.replace('\\', '/')
+    # Convert backslashes to forward slashes for Windows path compatibility;
+    # _pylit handles the quoting, so names and paths with quotes are safe.
+    targets_param = f", targets={_pylit(params.targets)}" if params.targets else ""
+    plan_param = f", planPath={_pylit(params.plan_path.replace(chr(92), '/'))}" if params.plan_path else ""
 
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
+    script = _TMPL_DEPLOY.substitute(app=_pylit(params.app_name),
+                                     app_path=_pylit(params.app_path.replace('\\', '/')),
+                                     targets_param=targets_param,
+                                     stage_mode=_pylit(params.stage_mode),
+                                     plan_param=plan_param)
 
-try:
-    deploy('{params.app_name}', '{app_path_safe}'{targets_param}, stageMode='{params.stage_mode}'{plan_param})
-    print('DEPLOY_SUCCESS: {params.app_name}')
-except Exception as e:
-    print('DEPLOY_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, DEFAULT_TIMEOUT * 2, conn=conn)  # Longer timeout for deployments
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, DEFAULT_TIMEOUT * 2)  # Longer timeout for deployments
+    markers = _result_markers(result)
 
-    if result['success'] and 'DEPLOY_SUCCESS' in result['stdout']:
+    if result['success'] and 'DEPLOY_SUCCESS' in markers:
         return f"Application **{params.app_name}** deployed successfully to {params.targets or 'default targets'}."
 
-    if 'DEPLOY_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'DEPLOY_ERROR' in l]
-        return f"Error deploying application: {error_line[0].replace('DEPLOY_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'DEPLOY_ERROR' in markers:
+        return f"Error deploying application: {markers['DEPLOY_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -823,28 +1850,23 @@ async def wlst_undeploy(params: UndeployInput) -> str:
     Returns:
         str: Undeployment result message
     '''
-    targets_param = f", targets='{params.targets}'" if params.targets else ""
+    targets_param = f", targets={_pylit(params.targets)}" if params.targets else ""
 
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
+    script = _TMPL_UNDEPLOY.substitute(app=_pylit(params.app_name), targets_param=targets_param)
 
-try:
-    undeploy('{params.app_name}'{targets_param})
-    print('UNDEPLOY_SUCCESS: {params.app_name}')
-except Exception as e:
-    print('UNDEPLOY_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT, conn=conn)
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT)
+    markers = _result_markers(result)
 
-    if result['success'] and 'UNDEPLOY_SUCCESS' in result['stdout']:
+    if result['success'] and 'UNDEPLOY_SUCCESS' in markers:
         return f"Application **{params.app_name}** undeployed successfully."
 
-    if 'UNDEPLOY_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'UNDEPLOY_ERROR' in l]
-        return f"Error undeploying application: {error_line[0].replace('UNDEPLOY_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'UNDEPLOY_ERROR' in markers:
+        return f"Error undeploying application: {markers['UNDEPLOY_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -867,26 +1889,21 @@ async def wlst_start_application(params: AppOperationInput) -> str:
     Returns:
         str: Operation result message
     '''
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
+    script = _TMPL_START_APP.substitute(app=_pylit(params.app_name))
 
-try:
-    startApplication('{params.app_name}')
-    print('START_SUCCESS: {params.app_name}')
-except Exception as e:
-    print('START_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT, conn=conn)
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT)
+    markers = _result_markers(result)
 
-    if result['success'] and 'START_SUCCESS' in result['stdout']:
+    if result['success'] and 'START_SUCCESS' in markers:
         return f"Application **{params.app_name}** started successfully."
 
-    if 'START_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'START_ERROR' in l]
-        return f"Error starting application: {error_line[0].replace('START_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'START_ERROR' in markers:
+        return f"Error starting application: {markers['START_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -909,26 +1926,21 @@ async def wlst_stop_application(params: AppOperationInput) -> str:
     Returns:
         str: Operation result message
     '''
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
+    script = _TMPL_STOP_APP.substitute(app=_pylit(params.app_name))
 
-try:
-    stopApplication('{params.app_name}')
-    print('STOP_SUCCESS: {params.app_name}')
-except Exception as e:
-    print('STOP_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT, conn=conn)
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT)
+    markers = _result_markers(result)
 
-    if result['success'] and 'STOP_SUCCESS' in result['stdout']:
+    if result['success'] and 'STOP_SUCCESS' in markers:
         return f"Application **{params.app_name}** stopped successfully."
 
-    if 'STOP_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'STOP_ERROR' in l]
-        return f"Error stopping application: {error_line[0].replace('STOP_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'STOP_ERROR' in markers:
+        return f"Error stopping application: {markers['STOP_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -951,26 +1963,21 @@ async def wlst_redeploy_application(params: AppOperationInput) -> str:
     Returns:
         str: Operation result message
     '''
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
+    script = _TMPL_REDEPLOY_APP.substitute(app=_pylit(params.app_name))
 
-try:
-    redeploy('{params.app_name}')
-    print('REDEPLOY_SUCCESS: {params.app_name}')
-except Exception as e:
-    print('REDEPLOY_ERROR: ' + str(e))
+    conn = _conn(params)
+    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT, conn=conn)
 
-{_build_disconnect_script()}
-'''
+    if result['success']:
+        _list_cache.invalidate_url(conn[0])
 
-    result = await _execute_wlst_script(script, params.timeout or DEFAULT_TIMEOUT)
+    markers = _result_markers(result)
 
-    if result['success'] and 'REDEPLOY_SUCCESS' in result['stdout']:
+    if result['success'] and 'REDEPLOY_SUCCESS' in markers:
         return f"Application **{params.app_name}** redeployed successfully."
 
-    if 'REDEPLOY_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'REDEPLOY_ERROR' in l]
-        return f"Error redeploying application: {error_line[0].replace('REDEPLOY_ERROR: ', '') if error_line else 'Unknown error'}"
+    if 'REDEPLOY_ERROR' in markers:
+        return f"Error redeploying application: {markers['REDEPLOY_ERROR'] or 'Unknown error'}"
 
     return _handle_error(result)
 
@@ -993,105 +2000,28 @@ async def wlst_list_applications(params: ListAppsInput) -> str:
     Returns:
         str: List of applications in requested format
     '''
-    script = f'''
-import json
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-apps = []
-
-# Get targets from serverConfig
-serverConfig()
-cd('AppDeployments')
-appDeploymentsRaw = ls(returnMap='true')
-appDeploymentsList = list(appDeploymentsRaw) if appDeploymentsRaw else []
-
-appTargetsMap = {{}}
-appInfoMap = {{}}
-
-for i in range(len(appDeploymentsList)):
-    appName = str(appDeploymentsList[i])
-
-    # Get targets
-    cd(appName + '/Targets')
-    targetsRaw = ls(returnMap='true')
-    if targetsRaw:
-        appTargetsMap[appName] = [str(t) for t in list(targetsRaw)]
-    else:
-        appTargetsMap[appName] = []
-    cd('../..')
-
-    # Get module type and source path
-    cd(appName)
-    appInfoMap[appName] = {{
-        'moduleType': str(cmo.getModuleType()) if cmo.getModuleType() else 'unknown',
-        'sourcePath': str(cmo.getSourcePath()) if cmo.getSourcePath() else ''
-    }}
-    cd('..')
-
-# Get runtime state from domainRuntime
-domainRuntime()
-cd('AppRuntimeStateRuntime/AppRuntimeStateRuntime')
-appNamesRaw = cmo.getApplicationIds()
-appNamesList = list(appNamesRaw) if appNamesRaw else []
-
-for i in range(len(appNamesList)):
-    appName = str(appNamesList[i])
-    targetStates = []
-    targets = appTargetsMap.get(appName, [])
-
-    for j in range(len(targets)):
-        targetName = str(targets[j])
-        try:
-            state = cmo.getCurrentState(appName, targetName)
-            targetStates.append({{'target': targetName, 'state': str(state) if state else 'None'}})
-        except:
-            targetStates.append({{'target': targetName, 'state': 'UNKNOWN'}})
-
-    intendedState = str(cmo.getIntendedState(appName))
-    appInfo = appInfoMap.get(appName, {{}})
-    apps.append({{
-        'name': appName,
-        'moduleType': appInfo.get('moduleType', 'unknown'),
-        'sourcePath': appInfo.get('sourcePath', ''),
-        'targets': targetStates,
-        'intendedState': intendedState
-    }})
-
-print('APPS_JSON:' + json.dumps(apps))
-{_build_disconnect_script()}
-'''
-
-    result = await _execute_wlst_script(script)
+    result = await _list_cache.get_or_fetch(
+        ('list_applications', params.get_admin_url(), params.get_username()),
+        lambda: _submit_wlst(_SCRIPT_LIST_APPS, conn=_conn(params)))
 
     if not result['success']:
         return _handle_error(result)
 
     apps = []
-    for line in result['stdout'].split('\n'):
-        if 'APPS_JSON:' in line:
-            try:
-                apps = json.loads(line.replace('APPS_JSON:', ''))
-            except:
-                pass
+    payload = _result_markers(result).get('APPS_JSON')
+    if payload:
+        try:
+            apps = _loads(payload)
+        except:
+            pass
 
     if not apps:
         return "No applications deployed or unable to parse application list."
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps({"applications": apps, "total": len(apps)}, indent=2)
-
-    lines = ["# Deployed Applications", "", f"**Total applications**: {len(apps)}", ""]
-    for app in apps:
-        # Use intendedState as the real indicator (getCurrentState has issues in WLS 14.x)
-        intended = app['intendedState']
-        app_emoji = "🟢" if intended == 'STATE_ACTIVE' else "🔴" if intended == 'STATE_PREPARED' else "🟡"
-        lines.append(f"## {app_emoji} **{app['name']}**")
-        lines.append(f"- **Type**: {app.get('moduleType', 'unknown')}")
-        lines.append(f"- **State**: {intended}")
-        lines.append(f"- **Targets**: {', '.join([t['target'] for t in app.get('targets', [])])}")
-        lines.append("")
+        return _dumps_pretty({"applications": apps, "total": len(apps)})
 
-    return '\n'.join(lines)
+    return ''.join(_render_applications(apps))
 
 @mcp.tool(
     name="wlst_server_health",
@@ -1112,47 +2042,37 @@ async def wlst_server_health(params: ServerHealthInput) -> str:
     Returns:
         str: Health status in requested format
     '''
-    server_filter = f"if serverName == '{params.server_name}':" if params.server_name else "if True:"
-
-    script = f'''
-import json
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-health_data = []
-domainRuntime()
-cd('ServerRuntimes')
-servers = ls(returnMap='true')
-
-for serverName in servers:
-    {server_filter}
-        cd(serverName)
-        state = cmo.getState()
-        health = cmo.getHealthState()
-
-        server_health = {{
-            'name': serverName,
-            'state': state,
-            'health': str(health),
-            'openSocketsCurrentCount': cmo.getOpenSocketsCurrentCount(),
-            'activationTime': str(cmo.getActivationTime()) if cmo.getActivationTime() else None
-        }}
-        health_data.append(server_health)
-        cd('..')
+    health_data = []
+    data = await _rest_get(params, '/management/weblogic/latest/domainRuntime/serverRuntimes?links=none'
+                           '&fields=name,state,healthState,openSocketsCurrentCount,activationTime')
+    if data is not None and 'items' in data:
+        for item in data['items']:
+            if params.server_name and item.get('name') != params.server_name:
+                continue
+            # REST reports health as a structured object; normalize to the
+            # HEALTH_* token the formatter and callers expect
+            symptom = str((item.get('healthState') or {}).get('state', ''))
+            health_data.append({
+                'name': item.get('name'),
+                'state': item.get('state'),
+                'health': 'HEALTH_OK' if symptom == 'ok' else symptom.upper(),
+                'openSocketsCurrentCount': item.get('openSocketsCurrentCount'),
+                'activationTime': str(item['activationTime']) if item.get('activationTime') else None
+            })
+    else:
+        server_filter = f"if serverName == '{params.server_name}':" if params.server_name else "if True:"
 
-print('HEALTH_JSON:' + json.dumps(health_data))
-{_build_disconnect_script()}
-'''
+        script = _TMPL_SERVER_HEALTH.substitute(server_filter=server_filter)
 
-    result = await _execute_wlst_script(script)
+        result = await _submit_wlst(script, conn=_conn(params))
 
-    if not result['success']:
-        return _handle_error(result)
+        if not result['success']:
+            return _handle_error(result)
 
-    health_data = []
-    for line in result['stdout'].split('\n'):
-        if 'HEALTH_JSON:' in line:
+        payload = _result_markers(result).get('HEALTH_JSON')
+        if payload:
             try:
-                health_data = json.loads(line.replace('HEALTH_JSON:', ''))
+                health_data = _loads(payload)
             except:
                 pass
 
@@ -1160,20 +2080,27 @@ print('HEALTH_JSON:' + json.dumps(health_data))
         return "No health data available or unable to parse."
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps({"servers": health_data}, indent=2)
-
-    lines = ["# Server Health Status", ""]
+        return _dumps_pretty({"servers": health_data})
+
+    buf = io.StringIO()
+    buf.write("# Server Health Status\n\n")
+    # Bind everything touched per row to locals once; on big domains this
+    # loop runs per server and LOAD_FAST beats repeated subscript/method
+    # lookups
+    write = buf.write
     for server in health_data:
-        health_emoji = "🟢" if "HEALTH_OK" in server.get('health', '') else "🔴"
-        lines.append(f"## {health_emoji} {server['name']}")
-        lines.append(f"- **State**: {server['state']}")
-        lines.append(f"- **Health**: {server['health']}")
-        lines.append(f"- **Open Sockets**: {server.get('openSocketsCurrentCount', 'N/A')}")
-        if server.get('activationTime'):
-            lines.append(f"- **Activation Time**: {server['activationTime']}")
-        lines.append("")
-
-    return '\n'.join(lines)
+        name = server['name']
+        state = server['state']
+        health = server.get('health', '')
+        sockets = server.get('openSocketsCurrentCount', 'N/A')
+        activation = server.get('activationTime')
+        health_emoji = "🟢" if "HEALTH_OK" in health else "🔴"
+        write(f"## {health_emoji} {name}\n- **State**: {state}\n- **Health**: {health}\n- **Open Sockets**: {sockets}\n")
+        if activation:
+            write(f"- **Activation Time**: {activation}\n")
+        write("\n")
+
+    return buf.getvalue()
 
 @mcp.tool(
     name="wlst_server_metrics",
@@ -1194,157 +2121,74 @@ async def wlst_server_metrics(params: ServerMetricsInput) -> str:
     Returns:
         str: Server metrics in requested format
     '''
-    script = f'''
-import json
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-metrics = {{'server': '{params.server_name}'}}
-
-try:
-    domainRuntime()
-    serverPath = 'ServerRuntimes/{params.server_name}'
-
-    # JVM metrics
-    if '{params.metric_type}' in ['all', 'jvm']:
-        try:
-            cd(serverPath + '/JVMRuntime/{params.server_name}')
-            metrics['jvm'] = {{
-                'heapSizeCurrent': cmo.getHeapSizeCurrent(),
-                'heapSizeMax': cmo.getHeapSizeMax(),
-                'heapFreeCurrent': cmo.getHeapFreeCurrent(),
-                'heapFreePercent': cmo.getHeapFreePercent(),
-                'uptime': cmo.getUptime()
-            }}
-        except Exception as jvmEx:
-            metrics['jvm'] = {{'error': str(jvmEx)}}
-
-    # Thread metrics
-    if '{params.metric_type}' in ['all', 'threads']:
-        try:
-            cd(serverPath + '/ThreadPoolRuntime/ThreadPoolRuntime')
-            metrics['threads'] = {{
-                'executeThreadTotalCount': cmo.getExecuteThreadTotalCount(),
-                'executeThreadIdleCount': cmo.getExecuteThreadIdleCount(),
-                'hoggingThreadCount': cmo.getHoggingThreadCount(),
-                'pendingUserRequestCount': cmo.getPendingUserRequestCount(),
-                'queueLength': cmo.getQueueLength()
-            }}
-        except Exception as threadEx:
-            metrics['threads'] = {{'error': str(threadEx)}}
-
-    # JDBC metrics
-    if '{params.metric_type}' in ['all', 'jdbc']:
-        try:
-            cd(serverPath + '/JDBCServiceRuntime/{params.server_name}')
-            dsRuntimes = ls('JDBCDataSourceRuntimeMBeans', returnMap='true')
-            jdbc_data = []
-            if dsRuntimes:
-                for dsName in dsRuntimes:
-                    cd('JDBCDataSourceRuntimeMBeans/' + dsName)
-                    jdbc_data.append({{
-                        'name': dsName,
-                        'state': cmo.getState(),
-                        'activeConnectionsCurrentCount': cmo.getActiveConnectionsCurrentCount(),
-                        'activeConnectionsHighCount': cmo.getActiveConnectionsHighCount(),
-                        'connectionsTotalCount': cmo.getConnectionsTotalCount(),
-                        'waitingForConnectionCurrentCount': cmo.getWaitingForConnectionCurrentCount()
-                    }})
-                    cd('..')
-            metrics['jdbc'] = jdbc_data
-        except Exception as jdbcEx:
-            metrics['jdbc'] = {{'error': str(jdbcEx)}}
+    metrics = await _rest_metrics(params)
 
-    print('METRICS_JSON:' + json.dumps(metrics))
-except Exception as e:
-    print('METRICS_ERROR: ' + str(e))
-
-{_build_disconnect_script()}
-'''
+    if metrics is None:
+        script = _TMPL_SERVER_METRICS.substitute(server_name=params.server_name, metric_type=params.metric_type)
 
-    result = await _execute_wlst_script(script)
+        result = await _submit_wlst(script, conn=_conn(params))
 
-    if not result['success']:
-        return _handle_error(result)
+        if not result['success']:
+            return _handle_error(result)
 
-    metrics = None
-    for line in result['stdout'].split('\n'):
-        if 'METRICS_JSON:' in line:
+        markers = _result_markers(result)
+        payload = markers.get('METRICS_JSON')
+        if payload:
             try:
-                metrics = json.loads(line.replace('METRICS_JSON:', ''))
+                metrics = _loads(payload)
             except:
                 pass
 
-    if not metrics:
-        if 'METRICS_ERROR' in result['stdout']:
-            error_line = [l for l in result['stdout'].split('\n') if 'METRICS_ERROR' in l]
-            return f"Error getting metrics: {error_line[0].replace('METRICS_ERROR: ', '') if error_line else 'Unknown error'}"
-        return "Unable to retrieve metrics."
+        if not metrics:
+            if 'METRICS_ERROR' in markers:
+                return f"Error getting metrics: {markers['METRICS_ERROR'] or 'Unknown error'}"
+            return "Unable to retrieve metrics."
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps(metrics, indent=2)
+        return _dumps_pretty(metrics)
 
-    lines = [f"# Metrics for {params.server_name}", ""]
+    buf = io.StringIO()
+    buf.write(f"# Metrics for {params.server_name}\n\n")
 
     if 'jvm' in metrics:
         jvm = metrics['jvm']
         if 'error' in jvm:
-            lines.extend([
-                "## JVM Metrics",
-                f"- **Error**: {jvm['error']}",
-                ""
-            ])
+            buf.write(f"## JVM Metrics\n- **Error**: {jvm['error']}\n\n")
         else:
             heap_used = jvm['heapSizeCurrent'] - jvm['heapFreeCurrent']
             heap_used_mb = heap_used / (1024 * 1024)
             heap_max_mb = jvm['heapSizeMax'] / (1024 * 1024)
-            lines.extend([
-                "## JVM Metrics",
-                f"- **Heap Used**: {heap_used_mb:.1f} MB / {heap_max_mb:.1f} MB ({100 - jvm['heapFreePercent']:.1f}%)",
-                f"- **Heap Free**: {jvm['heapFreePercent']:.1f}%",
-                f"- **Uptime**: {jvm['uptime'] / 1000:.0f} seconds",
-                ""
-            ])
+            buf.write("## JVM Metrics\n")
+            buf.write(f"- **Heap Used**: {heap_used_mb:.1f} MB / {heap_max_mb:.1f} MB ({100 - jvm['heapFreePercent']:.1f}%)\n")
+            buf.write(f"- **Heap Free**: {jvm['heapFreePercent']:.1f}%\n")
+            buf.write(f"- **Uptime**: {jvm['uptime'] / 1000:.0f} seconds\n\n")
 
     if 'threads' in metrics:
         t = metrics['threads']
         if 'error' in t:
-            lines.extend([
-                "## Thread Pool Metrics",
-                f"- **Error**: {t['error']}",
-                ""
-            ])
+            buf.write(f"## Thread Pool Metrics\n- **Error**: {t['error']}\n\n")
         else:
-            lines.extend([
-                "## Thread Pool Metrics",
-                f"- **Total Threads**: {t['executeThreadTotalCount']}",
-                f"- **Idle Threads**: {t['executeThreadIdleCount']}",
-                f"- **Hogging Threads**: {t['hoggingThreadCount']}",
-                f"- **Pending Requests**: {t['pendingUserRequestCount']}",
-                f"- **Queue Length**: {t['queueLength']}",
-                ""
-            ])
+            buf.write("## Thread Pool Metrics\n")
+            buf.write(f"- **Total Threads**: {t['executeThreadTotalCount']}\n")
+            buf.write(f"- **Idle Threads**: {t['executeThreadIdleCount']}\n")
+            buf.write(f"- **Hogging Threads**: {t['hoggingThreadCount']}\n")
+            buf.write(f"- **Pending Requests**: {t['pendingUserRequestCount']}\n")
+            buf.write(f"- **Queue Length**: {t['queueLength']}\n\n")
 
     if 'jdbc' in metrics and metrics['jdbc']:
         jdbc = metrics['jdbc']
         if isinstance(jdbc, dict) and 'error' in jdbc:
-            lines.extend([
-                "## JDBC Datasource Metrics",
-                f"- **Error**: {jdbc['error']}",
-                ""
-            ])
+            buf.write(f"## JDBC Datasource Metrics\n- **Error**: {jdbc['error']}\n\n")
         elif isinstance(jdbc, list):
-            lines.append("## JDBC Datasource Metrics")
+            buf.write("## JDBC Datasource Metrics\n")
             for ds in jdbc:
-                lines.extend([
-                    f"### {ds['name']}",
-                    f"- **State**: {ds['state']}",
-                    f"- **Active Connections**: {ds['activeConnectionsCurrentCount']} (High: {ds['activeConnectionsHighCount']})",
-                    f"- **Total Connections**: {ds['connectionsTotalCount']}",
-                    f"- **Waiting for Connection**: {ds['waitingForConnectionCurrentCount']}",
-                    ""
-                ])
+                buf.write(f"### {ds['name']}\n")
+                buf.write(f"- **State**: {ds['state']}\n")
+                buf.write(f"- **Active Connections**: {ds['activeConnectionsCurrentCount']} (High: {ds['activeConnectionsHighCount']})\n")
+                buf.write(f"- **Total Connections**: {ds['connectionsTotalCount']}\n")
+                buf.write(f"- **Waiting for Connection**: {ds['waitingForConnectionCurrentCount']}\n\n")
 
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 @mcp.tool(
     name="wlst_list_datasources",
@@ -1365,64 +2209,25 @@ async def wlst_list_datasources(params: DatasourceInput) -> str:
     Returns:
         str: List of datasources in requested format
     '''
-    script = f'''
-import json
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-datasources = []
-serverConfig()
-cd('JDBCSystemResources')
-dsNames = ls(returnMap='true')
-
-for dsName in dsNames:
-    cd(dsName + '/JDBCResource/' + dsName + '/JDBCDriverParams/' + dsName)
-    url = cmo.getUrl()
-    driverName = cmo.getDriverName()
-    cd('../../../../..')
-
-    cd(dsName)
-    targets = cmo.getTargets()
-    targetNames = [t.getName() for t in targets] if targets else []
-    cd('..')
-
-    datasources.append({{
-        'name': dsName,
-        'url': url,
-        'driver': driverName,
-        'targets': targetNames
-    }})
-
-print('DS_JSON:' + json.dumps(datasources))
-{_build_disconnect_script()}
-'''
-
-    result = await _execute_wlst_script(script)
+    result = await _list_cache.get_or_fetch(
+        ('list_datasources', params.get_admin_url(), params.get_username()),
+        lambda: _submit_wlst(_SCRIPT_LIST_DATASOURCES, conn=_conn(params)))
 
     if not result['success']:
         return _handle_error(result)
 
     datasources = []
-    for line in result['stdout'].split('\n'):
-        if 'DS_JSON:' in line:
-            try:
-                datasources = json.loads(line.replace('DS_JSON:', ''))
-            except:
-                pass
+    payload = _result_markers(result).get('DS_JSON')
+    if payload:
+        try:
+            datasources = _loads(payload)
+        except:
+            pass
 
     if params.response_format == ResponseFormat.JSON:
-        return json.dumps({"datasources": datasources, "total": len(datasources)}, indent=2)
-
-    lines = ["# JDBC Datasources", "", f"**Total**: {len(datasources)}", ""]
-    for ds in datasources:
-        lines.extend([
-            f"## {ds['name']}",
-            f"- **URL**: `{ds['url']}`",
-            f"- **Driver**: {ds['driver']}",
-            f"- **Targets**: {', '.join(ds['targets']) if ds['targets'] else 'None'}",
-            ""
-        ])
+        return _dumps_pretty({"datasources": datasources, "total": len(datasources)})
 
-    return '\n'.join(lines)
+    return ''.join(_render_datasources(datasources))
 
 @mcp.tool(
     name="wlst_list_jms_resources",
@@ -1443,108 +2248,114 @@ async def wlst_list_jms_resources(params: JMSInput) -> str:
     Returns:
         str: List of JMS resources in requested format
     '''
-    script = f'''
-import json
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-jms_data = {{'servers': [], 'modules': []}}
-
-serverConfig()
+    result = await _list_cache.get_or_fetch(
+        ('list_jms_resources', params.get_admin_url(), params.get_username()),
+        lambda: _submit_wlst(_SCRIPT_LIST_JMS, conn=_conn(params)))
 
-# JMS Servers
-cd('JMSServers')
-jmsServers = ls(returnMap='true')
-for serverName in jmsServers:
-    cd(serverName)
-    targets = cmo.getTargets()
-    targetNames = [t.getName() for t in targets] if targets else []
-    jms_data['servers'].append({{'name': serverName, 'targets': targetNames}})
-    cd('..')
+    if not result['success']:
+        return _handle_error(result)
 
-cd('..')
+    jms_data = {'servers': [], 'modules': []}
+    payload = _result_markers(result).get('JMS_JSON')
+    if payload:
+        try:
+            jms_data = _loads(payload)
+        except:
+            pass
 
-# JMS Modules
-cd('JMSSystemResources')
-modules = ls(returnMap='true')
-for moduleName in modules:
-    module_data = {{'name': moduleName, 'queues': [], 'topics': []}}
-    cd(moduleName + '/JMSResource/' + moduleName)
+    if params.response_format == ResponseFormat.JSON:
+        return _dumps_pretty(jms_data)
 
-    # Queues
-    try:
-        cd('Queues')
-        queues = ls(returnMap='true')
-        for queueName in queues:
-            cd(queueName)
-            jndiName = cmo.getJNDIName()
-            module_data['queues'].append({{'name': queueName, 'jndiName': jndiName}})
-            cd('..')
-        cd('..')
-    except:
-        pass
+    return ''.join(_render_jms(jms_data))
 
-    # Topics
-    try:
-        cd('Topics')
-        topics = ls(returnMap='true')
-        for topicName in topics:
-            cd(topicName)
-            jndiName = cmo.getJNDIName()
-            module_data['topics'].append({{'name': topicName, 'jndiName': jndiName}})
-            cd('..')
-        cd('..')
-    except:
-        pass
+@mcp.tool(
+    name="wlst_domain_snapshot",
+    annotations={
+        "title": "Domain Snapshot",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True
+    }
+)
+async def wlst_domain_snapshot(params: DomainSnapshotInput) -> str:
+    '''Collect servers, applications, health, datasources and JMS resources in one call.
 
-    jms_data['modules'].append(module_data)
-    cd('../../..')
+    Runs every listing section in a single WLST invocation over one
+    connection instead of the several separate calls a dashboard client
+    would otherwise make.
 
-print('JMS_JSON:' + json.dumps(jms_data))
-{_build_disconnect_script()}
-'''
+    Args:
+        params (DomainSnapshotInput): Connection and format parameters
 
-    result = await _execute_wlst_script(script)
+    Returns:
+        str: Combined domain snapshot in requested format
+    '''
+    result = await _submit_wlst(_SCRIPT_DOMAIN_SNAPSHOT, conn=_conn(params))
 
     if not result['success']:
         return _handle_error(result)
 
-    jms_data = {'servers': [], 'modules': []}
-    for line in result['stdout'].split('\n'):
-        if 'JMS_JSON:' in line:
+    markers = _result_markers(result)
+    sections: Dict[str, Any] = {}
+    for key, marker in (('servers', 'SERVERS_JSON'), ('applications', 'APPS_JSON'),
+                        ('health', 'HEALTH_JSON'), ('datasources', 'DS_JSON'),
+                        ('jms', 'JMS_JSON')):
+        payload = markers.get(marker)
+        if payload:
             try:
-                jms_data = json.loads(line.replace('JMS_JSON:', ''))
+                sections[key] = _loads(payload)
             except:
                 pass
 
-    if params.response_format == ResponseFormat.JSON:
-        return json.dumps(jms_data, indent=2)
-
-    lines = ["# JMS Resources", ""]
-
-    lines.append("## JMS Servers")
-    if jms_data['servers']:
-        for server in jms_data['servers']:
-            lines.append(f"- **{server['name']}** → {', '.join(server['targets']) if server['targets'] else 'No targets'}")
-    else:
-        lines.append("- No JMS servers configured")
-    lines.append("")
-
-    lines.append("## JMS Modules")
-    for module in jms_data['modules']:
-        lines.append(f"### {module['name']}")
-        if module['queues']:
-            lines.append("**Queues:**")
-            for q in module['queues']:
-                lines.append(f"- {q['name']} (`{q['jndiName']}`)")
-        if module['topics']:
-            lines.append("**Topics:**")
-            for t in module['topics']:
-                lines.append(f"- {t['name']} (`{t['jndiName']}`)")
-        if not module['queues'] and not module['topics']:
-            lines.append("- No queues or topics")
-        lines.append("")
+    if not sections:
+        return "No snapshot data available or unable to parse."
 
-    return '\n'.join(lines)
+    if params.response_format == ResponseFormat.JSON:
+        return _dumps_pretty(sections)
+
+    buf = io.StringIO()
+    buf.write("# Domain Snapshot\n\n")
+
+    servers = sections.get('servers', [])
+    if servers:
+        buf.write(f"## Servers ({len(servers)})\n")
+        for server in servers:
+            buf.write(f"- {_SERVER_STATE_EMOJI.get(server['state'], '🟡')} **{server['name']}**: {server['state']}\n")
+        buf.write("\n")
+
+    apps = sections.get('applications', [])
+    if apps:
+        buf.write(f"## Applications ({len(apps)})\n")
+        for app in apps:
+            targets = ', '.join([t['target'] for t in app.get('targets', [])])
+            buf.write(f"- {_APP_STATE_EMOJI.get(app['intendedState'], '🟡')} **{app['name']}** ({app.get('moduleType', 'unknown')}) → {targets}\n")
+        buf.write("\n")
+
+    health_data = sections.get('health', [])
+    if health_data:
+        buf.write("## Health\n")
+        for server in health_data:
+            health_emoji = "🟢" if "HEALTH_OK" in server.get('health', '') else "🔴"
+            buf.write(f"- {health_emoji} **{server['name']}**: {server['health']}\n")
+        buf.write("\n")
+
+    datasources = sections.get('datasources', [])
+    if datasources:
+        buf.write(f"## JDBC Datasources ({len(datasources)})\n")
+        for ds in datasources:
+            buf.write(f"- **{ds['name']}** → {', '.join(ds['targets']) if ds['targets'] else 'No targets'}\n")
+        buf.write("\n")
+
+    jms_data = sections.get('jms')
+    if jms_data:
+        buf.write(f"## JMS\n")
+        for server in jms_data.get('servers', []):
+            buf.write(f"- Server **{server['name']}** → {', '.join(server['targets']) if server['targets'] else 'No targets'}\n")
+        for module in jms_data.get('modules', []):
+            buf.write(f"- Module **{module['name']}**: {len(module['queues'])} queue(s), {len(module['topics'])} topic(s)\n")
+
+    return buf.getvalue()
 
 @mcp.tool(
     name="wlst_thread_dump",
@@ -1565,39 +2376,33 @@ async def wlst_thread_dump(params: ThreadDumpInput) -> str:
     Returns:
         str: Thread dump output
     '''
-    script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-try:
-    serverRuntime()
-    cd('/ServerRuntimes/{params.server_name}')
-    threadDump = cmo.getThreadStackDump()
-    print('THREAD_DUMP_START')
-    print(threadDump)
-    print('THREAD_DUMP_END')
-except Exception as e:
-    print('THREAD_DUMP_ERROR: ' + str(e))
-
-{_build_disconnect_script()}
-'''
+    script = _TMPL_THREAD_DUMP.substitute(server_name=params.server_name)
 
-    result = await _execute_wlst_script(script)
+    result = await _submit_wlst(script, conn=_conn(params))
 
     if not result['success']:
         return _handle_error(result)
 
-    if 'THREAD_DUMP_ERROR' in result['stdout']:
-        error_line = [l for l in result['stdout'].split('\n') if 'THREAD_DUMP_ERROR' in l]
-        return f"Error getting thread dump: {error_line[0].replace('THREAD_DUMP_ERROR: ', '') if error_line else 'Unknown error'}"
-
-    # Extract thread dump
-    output = result['stdout']
-    start_idx = output.find('THREAD_DUMP_START')
-    end_idx = output.find('THREAD_DUMP_END')
-
-    if start_idx != -1 and end_idx != -1:
-        thread_dump = output[start_idx + len('THREAD_DUMP_START'):end_idx].strip()
-        return f"# Thread Dump for {params.server_name}\n\n```\n{thread_dump}\n```"
+    markers = _result_markers(result)
+    if 'THREAD_DUMP_ERROR' in markers:
+        return f"Error getting thread dump: {markers.get('THREAD_DUMP_ERROR') or 'Unknown error'}"
+
+    # Extract the dump by slicing the raw bytes between the sentinels and
+    # decoding only that span; batch segments fall back to the str buffer
+    raw = result.get('stdout_bytes')
+    if raw is not None:
+        start_idx = raw.find(b'THREAD_DUMP_START')
+        end_idx = raw.find(b'THREAD_DUMP_END', start_idx + 1)
+        if start_idx != -1 and end_idx != -1:
+            thread_dump = raw[start_idx + len('THREAD_DUMP_START'):end_idx].decode('utf-8', errors='replace').strip()
+            return f"# Thread Dump for {params.server_name}\n\n```\n{thread_dump}\n```"
+    else:
+        output = result['stdout']
+        start_idx = output.find('THREAD_DUMP_START')
+        end_idx = output.find('THREAD_DUMP_END', start_idx + 1)
+        if start_idx != -1 and end_idx != -1:
+            thread_dump = output[start_idx + len('THREAD_DUMP_START'):end_idx].strip()
+            return f"# Thread Dump for {params.server_name}\n\n```\n{thread_dump}\n```"
 
     return "Unable to retrieve thread dump."
 
@@ -1629,29 +2434,26 @@ async def wlst_execute_script(params: ExecuteScriptInput) -> str:
     Returns:
         str: Script execution output
     '''
-    # Build the full script
-    admin_url = params.get_admin_url()
-    username = params.get_username()
-    password = params.get_password()
-    if admin_url and username and password:
-        full_script = f'''
-{_build_connect_script(params.get_admin_url(), params.get_username(), params.get_password())}
-
-# User script starts here
-{params.script}
-# User script ends here
-
-{_build_disconnect_script()}
-'''
-    else:
+    # Build the full script; run offline when credentials are incomplete
+    conn = params.get_creds()
+    if conn is None:
         full_script = params.script
+    else:
+        full_script = (_USER_SCRIPT_PRE, params.script, _USER_SCRIPT_POST)
+
+    result = await _execute_wlst_script(full_script, params.timeout or DEFAULT_TIMEOUT, conn=conn)
 
-    result = await _execute_wlst_script(full_script, params.timeout or DEFAULT_TIMEOUT)
+    # An arbitrary script may have changed anything in the domain
+    if result['success'] and conn:
+        _list_cache.invalidate_url(conn[0])
 
     if not result['success']:
-        return f"Script execution failed:\n\n**STDOUT:**\n```\n{result['stdout']}\n```\n\n**STDERR:**\n```\n{result['stderr']}\n```"
+        return ''.join((_ERR_PRE, result['stdout'], _ERR_MID, result['stderr'], _ERR_POST))
 
-    return f"Script executed successfully:\n\n```\n{result['stdout']}\n```"
+    stdout = result['stdout']
+    if len(stdout) > INLINE_OUTPUT_LIMIT:
+        return _spill_output(stdout)
+    return ''.join((_OK_PRE, stdout, _OK_POST))
 
 
 # =============================================================================